@@ -4,9 +4,6 @@ from pathlib import Path
 
 import streamlit as st
 
-from satisfactory.data.dsp_loader import DSPRecipeDatabase
-from satisfactory.data.factorio_loader import FactorioRecipeDatabase
-from satisfactory.data.loader import RecipeDatabase
 from satisfactory.engine.aggregator import ChainAggregator
 from satisfactory.engine.calculator import DependencyCalculator
 from satisfactory.models.game_mode import GameMode
@@ -31,8 +28,31 @@ def _get_storage_path(mode: GameMode) -> Path:
     return STORAGE_BASE / mode.save_folder
 
 
-def init_session_state():
-    """Initialize session state variables."""
+@st.cache_resource(show_spinner=False)
+def _load_db(mode: GameMode, path_str: str, mtime: float):
+    """Parse the recipe data for a game mode, shared across sessions.
+
+    Keyed by file mtime so editing the TSV invalidates the cached database.
+    """
+    data_path = Path(path_str)
+    # Import only the loader this mode needs, keeping the others off cold start
+    if mode in (GameMode.FACTORIO, GameMode.FOUNDRY):
+        # Foundry uses same TSV format as Factorio
+        from satisfactory.data.factorio_loader import FactorioRecipeDatabase
+
+        return FactorioRecipeDatabase(data_path)
+    elif mode == GameMode.DSP:
+        from satisfactory.data.dsp_loader import DSPRecipeDatabase
+
+        return DSPRecipeDatabase(data_path)
+
+    from satisfactory.data.loader import RecipeDatabase
+
+    return RecipeDatabase(data_path)
+
+
+def _init_ui_state():
+    """Initialize cheap session state (game mode, storage) before any parsing."""
     # Game mode (default to Satisfactory)
     if "game_mode" not in st.session_state:
         st.session_state.game_mode = GameMode.SATISFACTORY
@@ -47,6 +67,8 @@ def init_session_state():
         st.session_state.calculator = None
         st.session_state.aggregator = None
         st.session_state.storage = None
+        st.session_state.chain_names_cache = None
+        st.session_state.combine_chain_cache = None
         st.session_state.current_chain = None
         st.session_state.prev_target_item = None
         st.session_state.prev_target_rate = None
@@ -55,18 +77,27 @@ def init_session_state():
         st.session_state.widget_key_version = st.session_state.get("widget_key_version", 0) + 1
         st.session_state[current_mode_key] = mode
 
-    # Initialize database based on game mode
+    if st.session_state.get("storage") is None:
+        st.session_state.storage = ChainStorage(_get_storage_path(mode))
+
+    if "current_chain" not in st.session_state:
+        st.session_state.current_chain = None
+
+
+def _ensure_db_loaded():
+    """Load the recipe database and engines for the current game mode.
+
+    Called after the page header is drawn so the parse (on a cache miss)
+    doesn't hold up the first paint.
+    """
+    mode = st.session_state.game_mode
+
     if st.session_state.get("db") is None:
         data_path = _get_data_path(mode)
-        if mode == GameMode.FACTORIO:
-            st.session_state.db = FactorioRecipeDatabase(data_path)
-        elif mode == GameMode.DSP:
-            st.session_state.db = DSPRecipeDatabase(data_path)
-        elif mode == GameMode.FOUNDRY:
-            # Foundry uses same TSV format as Factorio
-            st.session_state.db = FactorioRecipeDatabase(data_path)
-        else:
-            st.session_state.db = RecipeDatabase(data_path)
+        with st.spinner("Loading recipes..."):
+            st.session_state.db = _load_db(
+                mode, str(data_path), data_path.stat().st_mtime
+            )
 
     if st.session_state.get("calculator") is None:
         st.session_state.calculator = DependencyCalculator(st.session_state.db)
@@ -74,12 +105,6 @@ def init_session_state():
     if st.session_state.get("aggregator") is None:
         st.session_state.aggregator = ChainAggregator(st.session_state.db)
 
-    if st.session_state.get("storage") is None:
-        st.session_state.storage = ChainStorage(_get_storage_path(mode))
-
-    if "current_chain" not in st.session_state:
-        st.session_state.current_chain = None
-
 
 def _handle_url_params():
     """Handle URL query parameters for deep linking to chains."""
@@ -165,11 +190,7 @@ def main():
 
         st.divider()
 
-    init_session_state()
-
-    # Load chain from URL if specified (after storage is ready)
-    if _load_chain_from_url():
-        st.rerun()
+    _init_ui_state()
 
     mode = st.session_state.game_mode
 
@@ -185,11 +206,7 @@ def main():
         unsafe_allow_html=True,
     )
 
-    # Sidebar for chain management (continued)
-    with st.sidebar:
-        render_sidebar()
-
-    # Main content
+    # Main content header (needs no recipe data, so draw it first)
     if mode == GameMode.SATISFACTORY:
         icon = "🏭"
     elif mode == GameMode.FACTORIO:
@@ -200,6 +217,16 @@ def main():
         icon = "🌟"
     st.title(f"{icon} {mode.display_name} Build Planner")
 
+    _ensure_db_loaded()
+
+    # Load chain from URL if specified (after storage is ready)
+    if _load_chain_from_url():
+        st.rerun()
+
+    # Sidebar for chain management (continued)
+    with st.sidebar:
+        render_sidebar()
+
     # Show some stats about loaded data
     db = st.session_state.db
     st.caption(
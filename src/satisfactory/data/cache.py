@@ -0,0 +1,102 @@
+"""Sidecar cache of parsed recipe databases.
+
+Parsing a TSV is paid on every process start; the parsed database is stored
+next to it as ``<file>.cache`` and reused while the TSV's mtime is unchanged.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from satisfactory.models.recipe import Building, IOType, Recipe, RecipeIO
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is a slower fallback
+    orjson = None
+
+# Bump whenever the payload layout or loader parsing rules change
+CACHE_VERSION = 1
+
+
+def _cache_path(tsv_path: Path) -> Path:
+    return tsv_path.with_name(tsv_path.name + ".cache")
+
+
+def read_cache(tsv_path: Path, loader: str) -> dict | None:
+    """Return the cached payload for a TSV, or None if missing or stale."""
+    try:
+        raw = _cache_path(tsv_path).read_bytes()
+        source_mtime = tsv_path.stat().st_mtime_ns
+        data = orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != CACHE_VERSION
+        or data.get("loader") != loader
+        or data.get("source_mtime_ns") != source_mtime
+    ):
+        return None
+    return data
+
+
+def write_cache(tsv_path: Path, loader: str, payload: dict) -> None:
+    """Store a parsed database next to its TSV (best effort)."""
+    try:
+        data = {
+            "version": CACHE_VERSION,
+            "loader": loader,
+            "source_mtime_ns": tsv_path.stat().st_mtime_ns,
+            **payload,
+        }
+        encoded = orjson.dumps(data) if orjson else json.dumps(data).encode("utf-8")
+        _cache_path(tsv_path).write_bytes(encoded)
+    except OSError:
+        pass  # e.g. read-only checkout; the TSV is simply parsed next time
+
+
+def recipes_to_cache(recipes: dict[str, Recipe]) -> list:
+    """Flatten recipes into JSON-friendly lists."""
+    return [
+        [
+            recipe.name,
+            recipe.runtime,
+            [
+                recipe.building.name,
+                recipe.building.power_draw,
+                recipe.building.floor_space,
+            ],
+            [[io.item_name, io.amount] for io in recipe.inputs],
+            [[io.item_name, io.amount] for io in recipe.outputs],
+        ]
+        for recipe in recipes.values()
+    ]
+
+
+def recipes_from_cache(
+    data: list, buildings: dict[str, Building] | None = None
+) -> dict[str, Recipe]:
+    """Rebuild recipes, sharing one Building per name (seeded from buildings)."""
+    shared = dict(buildings) if buildings else {}
+    recipes = {}
+    for name, runtime, (b_name, draw, size), inputs, outputs in data:
+        building = shared.get(b_name)
+        if building is None:
+            building = shared[b_name] = Building(b_name, draw, size)
+        name = sys.intern(name)
+        recipes[name] = Recipe(
+            name=name,
+            runtime=runtime,
+            building=building,
+            inputs=tuple(
+                RecipeIO(sys.intern(item), amount, IOType.INPUT)
+                for item, amount in inputs
+            ),
+            outputs=tuple(
+                RecipeIO(sys.intern(item), amount, IOType.OUTPUT)
+                for item, amount in outputs
+            ),
+        )
+    return recipes
@@ -1,49 +1,101 @@
 """TSV parser for Dyson Sphere Program recipes."""
 
 import csv
+import sys
 from collections import defaultdict
 from pathlib import Path
 
+from satisfactory.data.cache import (
+    read_cache,
+    recipes_from_cache,
+    recipes_to_cache,
+    write_cache,
+)
 from satisfactory.models.recipe import Building, IOType, Recipe, RecipeIO
 
 
+def _cell(row: list[str], index: int | None) -> str:
+    """Get a TSV cell by column index ("" if the column or cell is missing)."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
 class DSPRecipeDatabase:
     """Loads and indexes DSP recipes from TSV."""
 
     def __init__(self, tsv_path: Path):
         self.recipes: dict[str, Recipe] = {}  # recipe_name -> Recipe
-        self.recipes_by_output: dict[str, list[str]] = defaultdict(
-            list
-        )  # item -> [recipe_names]
-        self.all_items: set[str] = set()
+        self.recipes_by_output: dict[str, tuple[str, ...]] = {}  # item -> recipe_names
+        self.all_items: frozenset[str] = frozenset()
+        self._base_resources: frozenset[str] = frozenset()
+        # item -> first recipe with a positive output rate for it
+        self._default_recipes: dict[str, Recipe] = {}
+        # Read-only views for the UI, which asks on every rerun
+        self._recipes_for_item: dict[str, tuple[Recipe, ...]] = {}
+        self._sorted_producible_items: tuple[str, ...] = ()
+        self._producible_item_index: dict[str, int] = {}
         # DSP doesn't track buildings in the same way
         self._generic_building = Building("Assembler", 0.0, 0.0)
 
-        self._load_recipes(tsv_path)
+        cached = read_cache(tsv_path, type(self).__name__)
+        if cached is not None:
+            self._from_cache(cached)
+        else:
+            self._load_recipes(tsv_path)
+            write_cache(tsv_path, type(self).__name__, self._to_cache())
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        """Derive per-item lookups once, so queries are dict lookups."""
+        for item, names in self.recipes_by_output.items():
+            recipes = tuple(self.recipes[name] for name in names)
+            self._recipes_for_item[item] = recipes
+            # Fallback recipe when none is selected
+            for recipe in recipes:
+                if recipe.get_output_rate(item) > 0:
+                    self._default_recipes[item] = recipe
+                    break
+        self._sorted_producible_items = tuple(sorted(self.recipes_by_output))
+        self._producible_item_index = {
+            item: i for i, item in enumerate(self._sorted_producible_items)
+        }
 
     def _load_recipes(self, path: Path) -> None:
         """Parse DSP TSV and build recipe index."""
         # Group rows by recipe name
-        recipe_rows: dict[str, list[dict]] = defaultdict(list)
+        recipe_rows: dict[str, list[list[str]]] = defaultdict(list)
 
         with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
+            reader = csv.reader(f, delimiter="\t")
+            # Resolve column positions once rather than building a dict per row
+            header = {name: i for i, name in enumerate(next(reader, []))}
+            recipe_col = header.get("Recipe")
+            item_col = header.get("Item")
+            time_col = header.get("Seconds")
+            amount_col = header.get("Item Count")
+
             for row in reader:
-                recipe_name = row.get("Recipe", "").strip()
+                recipe_name = _cell(row, recipe_col).strip()
                 if not recipe_name:
                     continue
                 recipe_rows[recipe_name].append(row)
 
+        recipes_by_output: dict[str, list[str]] = defaultdict(list)
+        all_items: set[str] = set()
+        consumed_items: set[str] = set()
+
         # Build Recipe objects
         for recipe_name, rows in recipe_rows.items():
-            first_row = rows[0]
+            # Interned like item names below; chains key on recipe names too
+            recipe_name = sys.intern(recipe_name)
 
             # Parse time (crafting time in seconds)
             try:
-                runtime = float(first_row.get("Seconds", 0))
+                runtime = float(_cell(rows[0], time_col))
                 if runtime <= 0:
                     continue
-            except (ValueError, TypeError):
+            except ValueError:
                 continue
 
             # Parse inputs and outputs
@@ -51,24 +103,24 @@ class DSPRecipeDatabase:
             outputs = []
 
             for row in rows:
-                item_name = row.get("Item", "").strip()
+                # Interned so dict/set lookups on item names hit the identity fast path
+                item_name = sys.intern(_cell(row, item_col).strip())
                 if not item_name:
                     continue
 
                 try:
-                    amount = float(row.get("Item Count", 0))
-                except (ValueError, TypeError):
+                    amount = float(_cell(row, amount_col))
+                except ValueError:
                     continue
 
                 if amount == 0:
                     continue
 
-                self.all_items.add(item_name)
+                all_items.add(item_name)
 
                 if amount < 0:
-                    inputs.append(
-                        RecipeIO(item_name, abs(amount), IOType.INPUT)
-                    )
+                    # Store absolute value for inputs
+                    inputs.append(RecipeIO(item_name, -amount, IOType.INPUT))
                 else:
                     outputs.append(RecipeIO(item_name, amount, IOType.OUTPUT))
 
@@ -88,39 +140,79 @@ class DSPRecipeDatabase:
 
             # Index by output item
             for output in outputs:
-                self.recipes_by_output[output.item_name].append(recipe_name)
-
-    def get_recipes_for_item(self, item_name: str) -> list[Recipe]:
+                recipes_by_output[output.item_name].append(recipe_name)
+            consumed_items.update(inp.item_name for inp in inputs)
+
+        # Never mutated after load, so store compact tuples
+        self.recipes_by_output = {
+            item: tuple(names) for item, names in recipes_by_output.items()
+        }
+        self.all_items = frozenset(all_items)
+        # Items that are consumed but never produced
+        self._base_resources = frozenset(consumed_items - self.recipes_by_output.keys())
+
+    def _to_cache(self) -> dict:
+        """Parsed state for the sidecar cache."""
+        return {
+            "recipes": recipes_to_cache(self.recipes),
+            "recipes_by_output": {
+                item: list(names) for item, names in self.recipes_by_output.items()
+            },
+            "all_items": list(self.all_items),
+            "base_resources": list(self._base_resources),
+        }
+
+    def _from_cache(self, data: dict) -> None:
+        """Restore parsed state from the sidecar cache."""
+        self.recipes = recipes_from_cache(
+            data["recipes"], {self._generic_building.name: self._generic_building}
+        )
+        self.recipes_by_output = {
+            sys.intern(item): tuple(map(sys.intern, names))
+            for item, names in data["recipes_by_output"].items()
+        }
+        self.all_items = frozenset(map(sys.intern, data["all_items"]))
+        self._base_resources = frozenset(map(sys.intern, data["base_resources"]))
+
+    def get_recipes_for_item(self, item_name: str) -> tuple[Recipe, ...]:
         """Get all recipes that produce a given item."""
-        recipe_names = self.recipes_by_output.get(item_name, [])
-        return [self.recipes[name] for name in recipe_names if name in self.recipes]
+        return self._recipes_for_item.get(item_name, ())
 
     def get_recipe(self, recipe_name: str) -> Recipe | None:
         """Get a specific recipe by name."""
         return self.recipes.get(recipe_name)
 
-    def get_base_resources(self) -> set[str]:
-        """Items that are never produced (true base resources)."""
-        produced_items = set(self.recipes_by_output.keys())
-        consumed_items = set()
-        for recipe in self.recipes.values():
-            for inp in recipe.inputs:
-                consumed_items.add(inp.item_name)
+    def get_default_recipe(self, item_name: str) -> Recipe | None:
+        """First recipe that produces an item, used when none is selected."""
+        return self._default_recipes.get(item_name)
 
-        return consumed_items - produced_items
+    def get_base_resources(self) -> frozenset[str]:
+        """Items that are never produced (true base resources)."""
+        return self._base_resources
 
     def get_producible_items(self) -> set[str]:
         """All items that can be produced."""
         return set(self.recipes_by_output.keys())
 
+    def get_sorted_producible_items(self) -> tuple[str, ...]:
+        """All items that can be produced, sorted by name."""
+        return self._sorted_producible_items
+
+    def get_producible_item_index(self, item_name: str) -> int | None:
+        """Position of an item in get_sorted_producible_items(), if producible."""
+        return self._producible_item_index.get(item_name)
+
     def get_raw_resources(self) -> set[str]:
         """For DSP, returns empty - handled by get_base_resources."""
         return set()
 
     def get_default_imported_items(self) -> set[str]:
-        """Get items that should be imported by default."""
-        return self.get_base_resources()
+        """Get items that should be imported by default.
+
+        Returns a fresh set, since build chains mutate their imported items.
+        """
+        return set(self._base_resources)
 
-    def get_non_converter_recipes(self, item_name: str) -> list[Recipe]:
+    def get_non_converter_recipes(self, item_name: str) -> tuple[Recipe, ...]:
         """Get recipes - DSP has no Converter equivalent."""
         return self.get_recipes_for_item(item_name)
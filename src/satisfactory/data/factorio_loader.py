@@ -1,46 +1,100 @@
 """TSV parser for Factorio recipes."""
 
 import csv
+import sys
 from collections import defaultdict
 from pathlib import Path
 
+from satisfactory.data.cache import (
+    read_cache,
+    recipes_from_cache,
+    recipes_to_cache,
+    write_cache,
+)
 from satisfactory.models.recipe import Building, IOType, Recipe, RecipeIO
 
 
+def _cell(row: list[str], index: int | None) -> str:
+    """Get a TSV cell by column index ("" if the column or cell is missing)."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
 class FactorioRecipeDatabase:
     """Loads and indexes Factorio recipes from TSV."""
 
     def __init__(self, tsv_path: Path):
         self.recipes: dict[str, Recipe] = {}  # recipe_name -> Recipe
-        self.recipes_by_output: dict[str, list[str]] = defaultdict(
-            list
-        )  # item -> [recipe_names]
-        self.all_items: set[str] = set()
+        self.recipes_by_output: dict[str, tuple[str, ...]] = {}  # item -> recipe_names
+        self.all_items: frozenset[str] = frozenset()
+        self._base_resources: frozenset[str] = frozenset()
+        # item -> first recipe with a positive output rate for it
+        self._default_recipes: dict[str, Recipe] = {}
+        # Read-only views for the UI, which asks on every rerun
+        self._recipes_for_item: dict[str, tuple[Recipe, ...]] = {}
+        self._sorted_producible_items: tuple[str, ...] = ()
+        self._producible_item_index: dict[str, int] = {}
         # Factorio doesn't have buildings in the same way, use a generic one
         self._generic_building = Building("Assembler", 0.0, 0.0)
 
-        self._load_recipes(tsv_path)
+        cached = read_cache(tsv_path, type(self).__name__)
+        if cached is not None:
+            self._from_cache(cached)
+        else:
+            self._load_recipes(tsv_path)
+            write_cache(tsv_path, type(self).__name__, self._to_cache())
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        """Derive per-item lookups once, so queries are dict lookups."""
+        for item, names in self.recipes_by_output.items():
+            recipes = tuple(self.recipes[name] for name in names)
+            self._recipes_for_item[item] = recipes
+            # Fallback recipe when none is selected
+            for recipe in recipes:
+                if recipe.get_output_rate(item) > 0:
+                    self._default_recipes[item] = recipe
+                    break
+        self._sorted_producible_items = tuple(sorted(self.recipes_by_output))
+        self._producible_item_index = {
+            item: i for i, item in enumerate(self._sorted_producible_items)
+        }
 
     def _load_recipes(self, path: Path) -> None:
         """Parse Factorio TSV and build recipe index."""
         # Group rows by recipe name
-        recipe_rows: dict[str, list[dict]] = defaultdict(list)
+        recipe_rows: dict[str, list[list[str]]] = defaultdict(list)
 
         with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
+            reader = csv.reader(f, delimiter="\t")
+            # Resolve column positions once rather than building a dict per row
+            header = {name: i for i, name in enumerate(next(reader, []))}
+            recipe_col = header.get("recipe_name")
+            item_col = header.get("item_name")
+            io_type_col = header.get("input_or_output")
+            time_col = header.get("time")
+            amount_col = header.get("net_production")
+
             for row in reader:
-                recipe_name = row.get("recipe_name", "").strip()
+                recipe_name = _cell(row, recipe_col).strip()
                 if not recipe_name:
                     continue
                 recipe_rows[recipe_name].append(row)
 
+        recipes_by_output: dict[str, list[str]] = defaultdict(list)
+        all_items: set[str] = set()
+        consumed_items: set[str] = set()
+
         # Build Recipe objects
         for recipe_name, rows in recipe_rows.items():
+            # Interned like item names below; chains key on recipe names too
+            recipe_name = sys.intern(recipe_name)
             first_row = rows[0]
 
             # Parse time (crafting time in seconds)
             try:
-                runtime = float(first_row.get("time", 0))
+                runtime = float(_cell(first_row, time_col))
                 if runtime <= 0:
                     continue
             except (ValueError, TypeError):
@@ -51,21 +105,22 @@ class FactorioRecipeDatabase:
             outputs = []
 
             for row in rows:
-                item_name = row.get("item_name", "").strip()
+                # Interned so dict/set lookups on item names hit the identity fast path
+                item_name = sys.intern(_cell(row, item_col).strip())
                 if not item_name:
                     continue
 
-                io_type = row.get("input_or_output", "").strip().lower()
+                io_type = _cell(row, io_type_col).strip().lower()
 
                 try:
-                    amount = float(row.get("net_production", 0))
+                    amount = float(_cell(row, amount_col))
                 except (ValueError, TypeError):
                     continue
 
                 if amount == 0:
                     continue
 
-                self.all_items.add(item_name)
+                all_items.add(item_name)
 
                 if io_type == "input" or amount < 0:
                     inputs.append(
@@ -90,40 +145,80 @@ class FactorioRecipeDatabase:
 
             # Index by output item
             for output in outputs:
-                self.recipes_by_output[output.item_name].append(recipe_name)
-
-    def get_recipes_for_item(self, item_name: str) -> list[Recipe]:
+                recipes_by_output[output.item_name].append(recipe_name)
+            consumed_items.update(inp.item_name for inp in inputs)
+
+        # Never mutated after load, so store compact tuples
+        self.recipes_by_output = {
+            item: tuple(names) for item, names in recipes_by_output.items()
+        }
+        self.all_items = frozenset(all_items)
+        # Items that are consumed but never produced
+        self._base_resources = frozenset(consumed_items - self.recipes_by_output.keys())
+
+    def _to_cache(self) -> dict:
+        """Parsed state for the sidecar cache."""
+        return {
+            "recipes": recipes_to_cache(self.recipes),
+            "recipes_by_output": {
+                item: list(names) for item, names in self.recipes_by_output.items()
+            },
+            "all_items": list(self.all_items),
+            "base_resources": list(self._base_resources),
+        }
+
+    def _from_cache(self, data: dict) -> None:
+        """Restore parsed state from the sidecar cache."""
+        self.recipes = recipes_from_cache(
+            data["recipes"], {self._generic_building.name: self._generic_building}
+        )
+        self.recipes_by_output = {
+            sys.intern(item): tuple(map(sys.intern, names))
+            for item, names in data["recipes_by_output"].items()
+        }
+        self.all_items = frozenset(map(sys.intern, data["all_items"]))
+        self._base_resources = frozenset(map(sys.intern, data["base_resources"]))
+
+    def get_recipes_for_item(self, item_name: str) -> tuple[Recipe, ...]:
         """Get all recipes that produce a given item."""
-        recipe_names = self.recipes_by_output.get(item_name, [])
-        return [self.recipes[name] for name in recipe_names if name in self.recipes]
+        return self._recipes_for_item.get(item_name, ())
 
     def get_recipe(self, recipe_name: str) -> Recipe | None:
         """Get a specific recipe by name."""
         return self.recipes.get(recipe_name)
 
-    def get_base_resources(self) -> set[str]:
-        """Items that are never produced (true base resources)."""
-        produced_items = set(self.recipes_by_output.keys())
-        consumed_items = set()
-        for recipe in self.recipes.values():
-            for inp in recipe.inputs:
-                consumed_items.add(inp.item_name)
+    def get_default_recipe(self, item_name: str) -> Recipe | None:
+        """First recipe that produces an item, used when none is selected."""
+        return self._default_recipes.get(item_name)
 
-        return consumed_items - produced_items
+    def get_base_resources(self) -> frozenset[str]:
+        """Items that are never produced (true base resources)."""
+        return self._base_resources
 
     def get_producible_items(self) -> set[str]:
         """All items that can be produced."""
         return set(self.recipes_by_output.keys())
 
+    def get_sorted_producible_items(self) -> tuple[str, ...]:
+        """All items that can be produced, sorted by name."""
+        return self._sorted_producible_items
+
+    def get_producible_item_index(self, item_name: str) -> int | None:
+        """Position of an item in get_sorted_producible_items(), if producible."""
+        return self._producible_item_index.get(item_name)
+
     def get_raw_resources(self) -> set[str]:
         """For Factorio, this returns empty - no Converter equivalent."""
         return set()
 
     def get_default_imported_items(self) -> set[str]:
-        """Get items that should be imported by default."""
+        """Get items that should be imported by default.
+
+        Returns a fresh set, since build chains mutate their imported items.
+        """
         # For Factorio, just the base resources (ores, water, etc.)
-        return self.get_base_resources()
+        return set(self._base_resources)
 
-    def get_non_converter_recipes(self, item_name: str) -> list[Recipe]:
+    def get_non_converter_recipes(self, item_name: str) -> tuple[Recipe, ...]:
         """Get recipes - Factorio has no Converter equivalent."""
         return self.get_recipes_for_item(item_name)
@@ -1,76 +1,125 @@
 """TSV parser and recipe database."""
 
 import csv
+import sys
 from collections import defaultdict
 from pathlib import Path
 
+from satisfactory.data.cache import (
+    read_cache,
+    recipes_from_cache,
+    recipes_to_cache,
+    write_cache,
+)
 from satisfactory.models.recipe import Building, IOType, Recipe, RecipeIO
 
 
+def _cell(row: list[str], index: int | None) -> str:
+    """Get a TSV cell by column index ("" if the column or cell is missing)."""
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
 class RecipeDatabase:
     """Loads and indexes all recipes from TSV."""
 
     def __init__(self, tsv_path: Path):
         self.recipes: dict[str, Recipe] = {}  # recipe_name -> Recipe
-        self.recipes_by_output: dict[str, list[str]] = defaultdict(
-            list
-        )  # item -> [recipe_names]
-        self.all_items: set[str] = set()
+        self.recipes_by_output: dict[str, tuple[str, ...]] = {}  # item -> recipe_names
+        self.all_items: frozenset[str] = frozenset()
+        self._base_resources: frozenset[str] = frozenset()
+        self._raw_resources: frozenset[str] = frozenset()
         self.buildings: dict[str, Building] = {}
-
-        self._load_recipes(tsv_path)
+        # item -> first recipe with a positive output rate for it
+        self._default_recipes: dict[str, Recipe] = {}
+        # Read-only views for the UI, which asks on every rerun
+        self._recipes_for_item: dict[str, tuple[Recipe, ...]] = {}
+        self._sorted_producible_items: tuple[str, ...] = ()
+        self._producible_item_index: dict[str, int] = {}
+
+        cached = read_cache(tsv_path, type(self).__name__)
+        if cached is not None:
+            self._from_cache(cached)
+        else:
+            self._load_recipes(tsv_path)
+            write_cache(tsv_path, type(self).__name__, self._to_cache())
+        self._build_lookups()
+
+    def _build_lookups(self) -> None:
+        """Derive per-item lookups once, so queries are dict lookups."""
+        for item, names in self.recipes_by_output.items():
+            recipes = tuple(self.recipes[name] for name in names)
+            self._recipes_for_item[item] = recipes
+            # Fallback recipe when none is selected
+            for recipe in recipes:
+                if recipe.get_output_rate(item) > 0:
+                    self._default_recipes[item] = recipe
+                    break
+        self._sorted_producible_items = tuple(sorted(self.recipes_by_output))
+        self._producible_item_index = {
+            item: i for i, item in enumerate(self._sorted_producible_items)
+        }
 
     def _load_recipes(self, path: Path) -> None:
         """Parse TSV and build recipe index."""
         # Group rows by recipe name
-        recipe_rows: dict[str, list[dict]] = defaultdict(list)
+        recipe_rows: dict[str, list[list[str]]] = defaultdict(list)
 
         with open(path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
+            reader = csv.reader(f, delimiter="\t")
+            # Resolve column positions once rather than building a dict per row
+            header = {name: i for i, name in enumerate(next(reader, []))}
+            recipe_col = header.get("Recipe")
+            item_col = header.get("Item")
+            amount_col = header.get("Amount")
+            runtime_col = header.get("Runtime")
+            building_col = header.get("Building")
+            draw_col = header.get("Draw")
+            size_col = header.get("Size")
+
             for row in reader:
-                recipe_name = row.get("Recipe", "").strip()
+                recipe_name = _cell(row, recipe_col).strip()
 
                 # Skip empty, placeholder, or invalid rows
-                if not recipe_name:
+                if not recipe_name or recipe_name == "xxx":
                     continue
-                if recipe_name == "xxx":
-                    continue
-                building = row.get("Building", "").strip()
+                building = _cell(row, building_col).strip()
                 if not building or building.startswith("#"):
                     continue
 
                 recipe_rows[recipe_name].append(row)
 
+        recipes_by_output: dict[str, list[str]] = defaultdict(list)
+        all_items: set[str] = set()
+        consumed_items: set[str] = set()
+        # item -> True while every recipe producing it is a Converter recipe
+        converter_only: dict[str, bool] = {}
+
         # Build Recipe objects
         for recipe_name, rows in recipe_rows.items():
             first_row = rows[0]
+            # Names are interned like item names below: chains and the
+            # calculator look them up in dicts constantly
+            recipe_name = sys.intern(recipe_name)
+            building_name = sys.intern(_cell(first_row, building_col).strip())
 
             # Parse building
-            building_name = first_row.get("Building", "").strip()
-            if building_name and building_name not in self.buildings:
+            if building_name not in self.buildings:
                 try:
-                    draw = (
-                        float(first_row["Draw"])
-                        if first_row.get("Draw")
-                        else 0.0
-                    )
-                    size = (
-                        float(first_row["Size"])
-                        if first_row.get("Size")
-                        else 0.0
-                    )
-                    self.buildings[building_name] = Building(
-                        building_name, draw, size
-                    )
+                    # Missing draw/size default to 0
+                    draw = float(_cell(first_row, draw_col) or 0.0)
+                    size = float(_cell(first_row, size_col) or 0.0)
                 except ValueError:
                     continue
+                self.buildings[building_name] = Building(building_name, draw, size)
 
             # Parse runtime
             try:
-                runtime = float(first_row.get("Runtime", 0))
+                runtime = float(_cell(first_row, runtime_col))
                 if runtime <= 0:
                     continue
-            except (ValueError, TypeError):
+            except ValueError:
                 continue
 
             # Parse inputs and outputs
@@ -78,30 +127,24 @@ class RecipeDatabase:
             outputs = []
 
             for row in rows:
-                item_name = row.get("Item", "").strip()
+                # Interned so dict/set lookups on item names hit the identity fast path
+                item_name = sys.intern(_cell(row, item_col).strip())
                 if not item_name:
                     continue
 
-                # Skip rows with missing or zero amount
-                amount_str = row.get("Amount", "").strip()
-                if not amount_str:
-                    continue
+                # Skip rows with missing, invalid or zero amount
                 try:
-                    amount = float(amount_str)
+                    amount = float(_cell(row, amount_col))
                 except ValueError:
                     continue
-
-                # Skip zero amounts
                 if amount == 0:
                     continue
 
-                self.all_items.add(item_name)
+                all_items.add(item_name)
 
                 if amount < 0:
                     # Store absolute value for inputs
-                    inputs.append(
-                        RecipeIO(item_name, abs(amount), IOType.INPUT)
-                    )
+                    inputs.append(RecipeIO(item_name, -amount, IOType.INPUT))
                 else:
                     outputs.append(RecipeIO(item_name, amount, IOType.OUTPUT))
 
@@ -112,63 +155,106 @@ class RecipeDatabase:
             recipe = Recipe(
                 name=recipe_name,
                 runtime=runtime,
-                building=self.buildings.get(
-                    building_name, Building(building_name, 0, 0)
-                ),
+                building=self.buildings[building_name],
                 inputs=tuple(inputs),
                 outputs=tuple(outputs),
             )
 
             self.recipes[recipe_name] = recipe
+            is_converter = recipe.building.name == "Converter"
 
             # Index by output item
             for output in outputs:
-                self.recipes_by_output[output.item_name].append(recipe_name)
-
-    def get_recipes_for_item(self, item_name: str) -> list[Recipe]:
+                recipes_by_output[output.item_name].append(recipe_name)
+                converter_only[output.item_name] = (
+                    converter_only.get(output.item_name, True) and is_converter
+                )
+            consumed_items.update(inp.item_name for inp in inputs)
+
+        # Never mutated after load, so store compact tuples
+        self.recipes_by_output = {
+            item: tuple(names) for item, names in recipes_by_output.items()
+        }
+        self.all_items = frozenset(all_items)
+        # Items that are consumed but never produced
+        self._base_resources = frozenset(consumed_items - self.recipes_by_output.keys())
+        self._raw_resources = frozenset(
+            item for item, only in converter_only.items() if only
+        )
+
+    def _to_cache(self) -> dict:
+        """Parsed state for the sidecar cache."""
+        return {
+            "recipes": recipes_to_cache(self.recipes),
+            "recipes_by_output": {
+                item: list(names) for item, names in self.recipes_by_output.items()
+            },
+            "all_items": list(self.all_items),
+            "base_resources": list(self._base_resources),
+            "raw_resources": list(self._raw_resources),
+            "buildings": [
+                [b.name, b.power_draw, b.floor_space] for b in self.buildings.values()
+            ],
+        }
+
+    def _from_cache(self, data: dict) -> None:
+        """Restore parsed state from the sidecar cache."""
+        self.buildings = {
+            sys.intern(name): Building(sys.intern(name), draw, size)
+            for name, draw, size in data["buildings"]
+        }
+        self.recipes = recipes_from_cache(data["recipes"], self.buildings)
+        self.recipes_by_output = {
+            sys.intern(item): tuple(map(sys.intern, names))
+            for item, names in data["recipes_by_output"].items()
+        }
+        self.all_items = frozenset(map(sys.intern, data["all_items"]))
+        self._base_resources = frozenset(map(sys.intern, data["base_resources"]))
+        self._raw_resources = frozenset(map(sys.intern, data["raw_resources"]))
+
+    def get_recipes_for_item(self, item_name: str) -> tuple[Recipe, ...]:
         """Get all recipes that produce a given item."""
-        recipe_names = self.recipes_by_output.get(item_name, [])
-        return [self.recipes[name] for name in recipe_names if name in self.recipes]
+        return self._recipes_for_item.get(item_name, ())
 
     def get_recipe(self, recipe_name: str) -> Recipe | None:
         """Get a specific recipe by name."""
         return self.recipes.get(recipe_name)
 
-    def get_base_resources(self) -> set[str]:
-        """Items that are never produced (true base resources)."""
-        produced_items = set(self.recipes_by_output.keys())
-        # These are consumed but never produced
-        consumed_items = set()
-        for recipe in self.recipes.values():
-            for inp in recipe.inputs:
-                consumed_items.add(inp.item_name)
+    def get_default_recipe(self, item_name: str) -> Recipe | None:
+        """First recipe that produces an item, used when none is selected."""
+        return self._default_recipes.get(item_name)
 
-        return consumed_items - produced_items
+    def get_base_resources(self) -> frozenset[str]:
+        """Items that are never produced (true base resources)."""
+        return self._base_resources
 
     def get_producible_items(self) -> set[str]:
         """All items that can be produced."""
         return set(self.recipes_by_output.keys())
 
-    def get_raw_resources(self) -> set[str]:
+    def get_sorted_producible_items(self) -> tuple[str, ...]:
+        """All items that can be produced, sorted by name."""
+        return self._sorted_producible_items
+
+    def get_producible_item_index(self, item_name: str) -> int | None:
+        """Position of an item in get_sorted_producible_items(), if producible."""
+        return self._producible_item_index.get(item_name)
+
+    def get_raw_resources(self) -> frozenset[str]:
         """Items that can only be produced by Converter (effectively raw ores).
 
         These items should typically be treated as imported/base resources
         unless the user explicitly wants to use Converters.
         """
-        raw = set()
-        for item, recipe_names in self.recipes_by_output.items():
-            recipes = [self.recipes[n] for n in recipe_names if n in self.recipes]
-            # If all recipes for this item are Converter recipes, it's a raw resource
-            if recipes and all(r.building.name == "Converter" for r in recipes):
-                raw.add(item)
-        return raw
+        return self._raw_resources
 
     def get_default_imported_items(self) -> set[str]:
         """Get items that should be imported by default.
 
         Includes true base resources, raw ores (Converter-only items), and Water.
+        Returns a fresh set, since build chains mutate their imported items.
         """
-        return self.get_base_resources() | self.get_raw_resources() | {"Water"}
+        return set(self._base_resources | self._raw_resources | {"Water"})
 
     def get_non_converter_recipes(self, item_name: str) -> list[Recipe]:
         """Get recipes that produce an item, excluding Converter recipes."""
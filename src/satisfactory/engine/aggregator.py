@@ -1,23 +1,88 @@
 """Aggregator for computing build chain totals."""
 
-from satisfactory.data.loader import RecipeDatabase
-from satisfactory.models.build_chain import AggregatedTotals, BuildChain, ProductionNode
+from __future__ import annotations
+
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING
+
+from satisfactory.models.build_chain import AggregatedTotals, BuildChain, FlatChain
+from satisfactory.models.recipe import Recipe
+
+if TYPE_CHECKING:
+    # Annotation only; the app imports the selected game's loader itself
+    from satisfactory.data.loader import RecipeDatabase
+
+
+def _add_scaled(target: dict, source: dict, multiplier: float) -> None:
+    """Add every value of source, scaled by multiplier, into a defaultdict(float)."""
+    for key, value in source.items():
+        target[key] += value * multiplier
+
+
+def _group_machine_counts(
+    by_recipe: dict[tuple[str, str], float],
+) -> list[tuple[str, list[tuple[str, float]]]]:
+    """Group (building, recipe) counts by building for the summary table."""
+    by_building: defaultdict[str, list[tuple[str, float]]] = defaultdict(list)
+    for (building, recipe), count in by_recipe.items():
+        by_building[building].append((recipe, count))
+    grouped = []
+    for building in sorted(by_building):
+        recipes = by_building[building]
+        recipes.sort(key=lambda x: -x[1])
+        grouped.append((building, recipes))
+    return grouped
 
 
 class ChainAggregator:
     """Calculates aggregate totals for a build chain."""
 
+    # Number of aggregated trees kept in the LRU cache
+    CACHE_SIZE = 64
+
     def __init__(self, db: RecipeDatabase):
         self.db = db
+        # Root node id -> totals. Node ids are never reused within a process
+        # and every recalculation (or load) builds a new tree, so an id seen
+        # before refers to an unchanged tree unless it was invalidate()d.
+        self._cache: OrderedDict[int, AggregatedTotals] = OrderedDict()
 
     def aggregate(self, chain: BuildChain) -> AggregatedTotals:
-        """Calculate all totals for the chain."""
-        totals = AggregatedTotals()
+        """Calculate all totals for the chain.
 
+        Results are cached per production tree and shared between callers,
+        so treat the returned totals as read-only.
+        """
         if not chain.root_node:
-            return totals
+            return AggregatedTotals()
+
+        key = chain.root_node.id
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        totals = self._aggregate_tree(chain.flatten())
 
-        self._aggregate_node(chain.root_node, totals)
+        self._cache[key] = totals
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return totals
+
+    def invalidate(self, chain: BuildChain) -> None:
+        """Drop cached totals for a chain whose tree was changed in place."""
+        if chain.root_node:
+            self._cache.pop(chain.root_node.id, None)
+
+    def _aggregate_tree(self, flat: FlatChain) -> AggregatedTotals:
+        """Aggregate a production tree and derive net balance."""
+        totals = AggregatedTotals()
+
+        self._aggregate_nodes(flat, totals)
+        root = flat.nodes[0]
+        if root.is_imported:
+            # An imported target has no parent consuming it; keep it listed
+            totals.gross_consumption.setdefault(root.item_name, 0.0)
 
         # Calculate net balance
         all_items = set(totals.gross_production.keys()) | set(
@@ -33,66 +98,87 @@ class ChainAggregator:
             if net < -0.001:  # Small tolerance for floating point
                 totals.base_resources[item] = abs(net)
 
-        return totals
-
-    def _aggregate_node(
-        self, node: ProductionNode, totals: AggregatedTotals
-    ) -> None:
-        """Recursively aggregate a node and its children."""
-        if node.is_imported:
-            # Track as base resource consumption
-            totals.gross_consumption[node.item_name] = (
-                totals.gross_consumption.get(node.item_name, 0.0)
-            )
-            return
-
-        recipe = self.db.get_recipe(node.recipe_name)
-        if not recipe:
-            return
-
-        # Get multipliers from node (default 1.0 for backwards compat)
-        speed = node.speed_multiplier
-        productivity = node.productivity_multiplier
-
-        # Track production (all outputs, including byproducts)
-        # Production scales with speed AND productivity
-        for output in recipe.outputs:
-            if output.item_name == "MW":
-                continue  # Power tracked separately
-            output_rate = recipe.get_output_rate(output.item_name) * speed * productivity * node.machine_count
-            totals.gross_production[output.item_name] = (
-                totals.gross_production.get(output.item_name, 0.0) + output_rate
-            )
-
-        # Track consumption (inputs used by this node)
-        # Consumption scales with speed only (NOT productivity)
-        for input_io in recipe.inputs:
-            input_rate = recipe.get_input_rate(input_io.item_name) * speed * node.machine_count
-            totals.gross_consumption[input_io.item_name] = (
-                totals.gross_consumption.get(input_io.item_name, 0.0) + input_rate
-            )
-
-        # Track machines by building type
-        building_name = recipe.building.name
-        totals.machine_counts[building_name] = (
-            totals.machine_counts.get(building_name, 0.0) + node.machine_count
+        # Grouped once here, as totals are cached, rather than on each render
+        totals.machine_counts_grouped = _group_machine_counts(
+            totals.machine_counts_by_recipe
         )
+        return totals
 
-        # Track machines by (building, recipe)
-        key = (building_name, node.recipe_name)
-        totals.machine_counts_by_recipe[key] = (
-            totals.machine_counts_by_recipe.get(key, 0.0) + node.machine_count
-        )
-
-        # Track power
-        totals.total_power += node.power_consumption
-
-        # Track floor space
-        totals.total_floor_space += node.floor_space
+    def _aggregate_nodes(self, flat: FlatChain, totals: AggregatedTotals) -> None:
+        """Aggregate every node of a flattened tree in pre-order.
 
-        # Recurse to children
-        for child in node.children:
-            self._aggregate_node(child, totals)
+        Every rate is linear in machine count, so the walk only sums machine
+        counts per (recipe, speed, productivity); each recipe's rates are then
+        applied once, however often it repeats across the tree. For the same
+        reason scaled copies of a subtree are skipped, their share folded into
+        the original nodes' weights.
+        """
+        recipes: dict[str, Recipe] = {}
+        machines: defaultdict[tuple[str, float, float], float] = defaultdict(float)
+
+        nodes = flat.nodes
+        subtree_end = flat.subtree_end
+        sources = flat.source
+        weights = flat.multiplicity()
+        index = 0
+        count = len(nodes)
+        while index < count:
+            if sources[index] >= 0:
+                # Copied subtree, counted through its source's weight
+                index = subtree_end[index]
+                continue
+            node = nodes[index]
+            weight = weights[index]
+
+            if node.is_imported:
+                # Already counted as its parent's input consumption
+                index = subtree_end[index]
+                continue
+            if not node.machine_count:
+                # Idle branch: child rates scale with this count, so the whole
+                # subtree contributes nothing
+                index = subtree_end[index]
+                continue
+
+            recipe = self.db.get_recipe(node.recipe_name)
+            if not recipe:
+                index = subtree_end[index]
+                continue
+            recipes[recipe.name] = recipe
+
+            # Get multipliers from node (default 1.0 for backwards compat)
+            key = (recipe.name, node.speed_multiplier, node.productivity_multiplier)
+            machines[key] += node.machine_count * weight
+
+            # Track power
+            totals.total_power += node.power_consumption * weight
+
+            # Track floor space
+            totals.total_floor_space += node.floor_space * weight
+
+            # Children follow directly in pre-order
+            index += 1
+
+        # One pass per distinct recipe setting (tens per chain)
+        for (recipe_name, speed, productivity), machine_count in machines.items():
+            recipe = recipes[recipe_name]
+
+            # Track production (all outputs, including byproducts)
+            # Production scales with speed AND productivity
+            for item_name, rate in recipe.output_rates:
+                totals.gross_production[item_name] += rate * speed * productivity * machine_count
+
+            # Track consumption (inputs used by these machines)
+            # Consumption scales with speed only (NOT productivity)
+            for item_name, rate in recipe.input_rates:
+                totals.gross_consumption[item_name] += rate * speed * machine_count
+
+            # Track machines by building type
+            building_name = recipe.building.name
+            totals.machine_counts[building_name] += machine_count
+
+            # Track machines by (building, recipe)
+            totals.machine_counts_by_recipe[(building_name, recipe_name)] += machine_count
 
     def combine_chains(
         self,
@@ -104,43 +190,33 @@ class ChainAggregator:
         Example: 2x Computer Chain + 1x Motor Chain
         """
         combined = AggregatedTotals()
+        # Net balance is linear too, so merge each chain's net alongside
+        # production/consumption instead of re-deriving it afterwards
+        net_balance: defaultdict[str, float] = defaultdict(float)
 
         for chain, multiplier in chains:
             chain_totals = self.aggregate(chain)
 
             # Scale and add
-            for item, rate in chain_totals.gross_production.items():
-                combined.gross_production[item] = (
-                    combined.gross_production.get(item, 0.0) + rate * multiplier
-                )
-
-            for item, rate in chain_totals.gross_consumption.items():
-                combined.gross_consumption[item] = (
-                    combined.gross_consumption.get(item, 0.0) + rate * multiplier
-                )
-
-            for building, count in chain_totals.machine_counts.items():
-                combined.machine_counts[building] = (
-                    combined.machine_counts.get(building, 0.0) + count * multiplier
-                )
-
-            for key, count in chain_totals.machine_counts_by_recipe.items():
-                combined.machine_counts_by_recipe[key] = (
-                    combined.machine_counts_by_recipe.get(key, 0.0) + count * multiplier
-                )
+            _add_scaled(combined.gross_production, chain_totals.gross_production, multiplier)
+            _add_scaled(combined.gross_consumption, chain_totals.gross_consumption, multiplier)
+            _add_scaled(net_balance, chain_totals.net_balance, multiplier)
+            _add_scaled(combined.machine_counts, chain_totals.machine_counts, multiplier)
+            _add_scaled(
+                combined.machine_counts_by_recipe,
+                chain_totals.machine_counts_by_recipe,
+                multiplier,
+            )
 
             combined.total_power += chain_totals.total_power * multiplier
             combined.total_floor_space += chain_totals.total_floor_space * multiplier
 
-        # Recalculate net balance
-        all_items = set(combined.gross_production.keys()) | set(
-            combined.gross_consumption.keys()
+        combined.net_balance = dict(net_balance)
+        for item, net in combined.net_balance.items():
+            if net < -0.001:
+                combined.base_resources[item] = abs(net)
+        combined.machine_counts_grouped = _group_machine_counts(
+            combined.machine_counts_by_recipe
         )
-        for item in all_items:
-            prod = combined.gross_production.get(item, 0.0)
-            cons = combined.gross_consumption.get(item, 0.0)
-            combined.net_balance[item] = prod - cons
-            if prod - cons < -0.001:
-                combined.base_resources[item] = abs(prod - cons)
 
         return combined
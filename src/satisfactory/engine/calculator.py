@@ -1,18 +1,57 @@
 """Dependency resolution calculator."""
 
-from typing import Optional
-from uuid import UUID, uuid4
+from __future__ import annotations
 
-from satisfactory.data.loader import RecipeDatabase
-from satisfactory.models.build_chain import BuildChain, ProductionNode
+from typing import TYPE_CHECKING, Optional
+
+from satisfactory.models.build_chain import (
+    BuildChain,
+    NO_CHILDREN,
+    FlatChain,
+    ProductionNode,
+    next_node_id,
+)
+from satisfactory.models.recipe import Recipe
+
+if TYPE_CHECKING:
+    # Annotation only; the app imports the selected game's loader itself
+    from satisfactory.data.loader import RecipeDatabase
+
+_EXIT = object()  # Work-stack marker closing an expanded node
+
+
+def _override_trie(
+    overrides: dict[tuple[str, ...], bool], parent_path: tuple[str, ...]
+) -> dict | None:
+    """Trie of per-node import overrides, as seen from below parent_path.
+
+    Each level maps item name -> child level; the None key holds the override
+    for the path ending there. Walking it alongside the tree replaces hashing
+    the whole path tuple at every node, and a missing level means nothing
+    under that path is overridden. Returns None if nothing is.
+    """
+    root: dict = {}
+    for path, imported in overrides.items():
+        level = root
+        for item in path:
+            level = level.setdefault(item, {})
+        level[None] = imported
+    for item in parent_path:
+        root = root.get(item)
+        if root is None:
+            break
+    return root or None
 
 
 class DependencyCalculator:
-    """Recursively calculates production requirements."""
+    """Calculates production requirements by depth-first expansion."""
 
     def __init__(self, db: RecipeDatabase):
         self.db = db
-        self._visited_stack: set[str] = set()  # For cycle detection
+        # Finished subtrees by item, reused as scaled copies within one call:
+        # item -> (flat index of prototype, items it cycle-checked, those that
+        # were ancestors)
+        self._subtree_cache: dict[str, tuple[int, frozenset[str], frozenset[str]]] = {}
 
     def calculate_chain(
         self,
@@ -23,11 +62,11 @@ class DependencyCalculator:
         productivity_multipliers: dict[str, float],
         imported_items: set[str],
         imported_node_overrides: dict[tuple[str, ...], bool] | None = None,
-        parent_id: Optional[UUID] = None,
+        parent_id: Optional[int] = None,
         parent_path: tuple[str, ...] = (),
     ) -> ProductionNode:
         """
-        Recursively build production tree for target item at desired rate.
+        Build production tree for target item at desired rate.
 
         Args:
             target_item: Item to produce
@@ -40,63 +79,150 @@ class DependencyCalculator:
             parent_id: Parent node ID for tree structure
             parent_path: Path of item names from root to parent
         """
+        return self._build(
+            target_item,
+            target_rate,
+            recipe_selections,
+            speed_multipliers,
+            productivity_multipliers,
+            imported_items,
+            imported_node_overrides,
+            parent_id,
+            parent_path,
+        ).nodes[0]
+
+    def _build(
+        self,
+        target_item: str,
+        target_rate: float,
+        recipe_selections: dict[str, str],
+        speed_multipliers: dict[str, float],
+        productivity_multipliers: dict[str, float],
+        imported_items: set[str],
+        imported_node_overrides: dict[tuple[str, ...], bool] | None = None,
+        parent_id: Optional[int] = None,
+        parent_path: tuple[str, ...] = (),
+        ancestors: frozenset[str] = frozenset(),
+    ) -> FlatChain:
+        """Build the tree as calculate_chain does, returning its flat layout.
+
+        Nodes are created in pre-order, so each is appended to the flat lists
+        as it is made and its subtree end is filled in once it is closed.
+        ancestors are items already being expanded above the root (when
+        rebuilding a subtree in place), which cut cycles like tree items do.
+        """
         if imported_node_overrides is None:
             imported_node_overrides = {}
 
-        current_path = parent_path + (target_item,)
+        # Selections and multipliers are fixed for one call, so the item alone
+        # keys the subtree cache; start afresh since they may differ next time
+        self._subtree_cache.clear()
 
-        node = ProductionNode(
-            id=uuid4(),
-            item_name=target_item,
-            target_rate=target_rate,
-            parent_id=parent_id,
-            path=current_path,
-        )
+        # Items on the path from the root to the current node, for cycle
+        # detection; local to the call, so an aborted run leaves nothing behind
+        visited: set[str] = set(ancestors)
+        subtree_cache = self._subtree_cache
+        recipes_by_output = self.db.recipes_by_output
+
+        flat = FlatChain()
+        nodes = flat.nodes
+        subtree_end = flat.subtree_end
 
-        # Check if imported (per-node override takes precedence)
-        if current_path in imported_node_overrides:
-            is_imported = imported_node_overrides[current_path]
-        else:
-            is_imported = target_item in imported_items
-
-        if is_imported:
-            node.is_imported = True
-            return node
-
-        # Check if base resource (no recipes produce it)
-        recipes = self.db.get_recipes_for_item(target_item)
-        if not recipes:
-            node.is_imported = True  # Treat as base resource
-            return node
-
-        # Cycle detection for recipes like Recycled Plastic <-> Recycled Rubber
-        if target_item in self._visited_stack:
-            # Mark as imported to break cycle - user must handle manually
-            node.is_imported = True
-            return node
-
-        self._visited_stack.add(target_item)
-
-        try:
-            # Get selected recipe (or default to first available)
-            selected_recipe_name = recipe_selections.get(target_item)
+        # Visits are (item, rate, parent index, parent's checked items,
+        # parent's override trie level); an _EXIT entry closes an expanded
+        # node once all its inputs are built
+        stack: list[tuple] = [
+            (
+                target_item,
+                target_rate,
+                -1,
+                None,
+                _override_trie(imported_node_overrides, parent_path),
+            )
+        ]
+        while stack:
+            entry = stack.pop()
+            if entry[0] is _EXIT:
+                _, index, checked, parent_checked, overrides = entry
+                node = nodes[index]
+                subtree_end[index] = len(nodes)
+                visited.discard(node.item_name)
+                checked = frozenset(checked)
+                if node.target_rate and overrides is None:
+                    subtree_cache[node.item_name] = (index, checked, checked & visited)
+                if parent_checked is not None:
+                    parent_checked |= checked
+                continue
+
+            item, rate, parent_index, parent_checked, overrides = entry
+            if overrides is not None:
+                overrides = overrides.get(item)
+            if parent_index < 0:
+                parent = None
+                node_parent_id, node_parent_path = parent_id, parent_path
+            else:
+                parent = nodes[parent_index]
+                node_parent_id, node_parent_path = parent.id, parent.path
+            current_path = node_parent_path + (item,)
+
+            # Check if imported (per-node override takes precedence)
+            if overrides is not None and None in overrides:
+                is_imported = overrides[None]
+            else:
+                is_imported = item in imported_items
+
+            node = None
             recipe = None
-            if selected_recipe_name:
-                recipe = self.db.get_recipe(selected_recipe_name)
-                # Verify this recipe actually produces the target item
-                if recipe and recipe.get_output_rate(target_item) <= 0:
-                    recipe = None
-
-            if not recipe:
-                # Find first recipe that produces this item
-                for r in recipes:
-                    if r.get_output_rate(target_item) > 0:
-                        recipe = r
-                        break
-
-            if not recipe:
-                node.is_imported = True
-                return node
+            # Base resources (no recipes produce them) are left imported
+            if is_imported or item not in recipes_by_output:
+                pass
+            elif item in visited:
+                # Cycle detection for recipes like Recycled Plastic <-> Recycled
+                # Rubber: left imported to break it - user must handle manually
+                if parent_checked is not None:
+                    parent_checked.add(item)
+            else:
+                # Reuse an earlier copy of this subtree when no override lies
+                # beneath this path and cycles would be cut at the same items
+                cached = None
+                if overrides is None:
+                    cached = subtree_cache.get(item)
+                if cached is not None and cached[1] & visited == cached[2]:
+                    node = self._copy_subtree(
+                        flat,
+                        cached[0],
+                        rate,
+                        parent_index,
+                        node_parent_id,
+                        current_path,
+                    )
+                    if parent_checked is not None:
+                        parent_checked |= cached[1]
+                else:
+                    recipe = self._select_recipe(item, recipe_selections)
+
+            if node is None:
+                node = ProductionNode(
+                    id=next_node_id(),
+                    item_name=item,
+                    target_rate=rate,
+                    is_imported=recipe is None,
+                    parent_id=node_parent_id,
+                    path=current_path,
+                    # Imported leaves never get children: share the empty tuple
+                    children=NO_CHILDREN if recipe is None else [],
+                )
+                index = len(nodes)
+                nodes.append(node)
+                flat.parent.append(parent_index)
+                flat.depth.append(flat.depth[parent_index] + 1 if parent else 0)
+                subtree_end.append(index + 1)
+                flat.source.append(-1)
+                flat.scale.append(1.0)
+            if parent is not None:
+                parent.children.append(node)
+            if recipe is None:
+                continue
 
             node.recipe_name = recipe.name
 
@@ -111,10 +237,10 @@ class DependencyCalculator:
             # Calculate machines needed
             # Output rate scales with speed AND productivity
             # machine_count = target / (base_output * speed * productivity)
-            output_rate = recipe.get_output_rate(target_item) * speed * productivity
+            output_rate = recipe.get_output_rate(item) * speed * productivity
             if output_rate > 0:
-                node.machine_count = target_rate / output_rate
-                node.actual_production_rate = target_rate
+                node.machine_count = rate / output_rate
+                node.actual_production_rate = rate
 
                 # Power and floor space
                 node.power_consumption = (
@@ -128,36 +254,209 @@ class DependencyCalculator:
                     # Negative = generation
                     node.power_consumption = -node.machine_count * power_output
 
-            # Process inputs recursively
+            # Inputs are built before the node is closed; reversed so they pop
+            # (and are appended as children) in recipe order
             # Input rate scales with speed only (NOT productivity)
-            for input_io in recipe.inputs:
-                input_rate = (
-                    recipe.get_input_rate(input_io.item_name) * speed * node.machine_count
+            checked = {item}
+            visited.add(item)
+            stack.append((_EXIT, index, checked, parent_checked, overrides))
+            machine_count = node.machine_count
+            for input_item, input_rate in reversed(recipe.child_input_rates):
+                stack.append(
+                    (
+                        input_item,
+                        input_rate * speed * machine_count,
+                        index,
+                        checked,
+                        overrides,
+                    )
                 )
 
-                child_node = self.calculate_chain(
-                    target_item=input_io.item_name,
-                    target_rate=input_rate,
-                    recipe_selections=recipe_selections,
-                    speed_multipliers=speed_multipliers,
-                    productivity_multipliers=productivity_multipliers,
-                    imported_items=imported_items,
-                    imported_node_overrides=imported_node_overrides,
-                    parent_id=node.id,
-                    parent_path=current_path,
-                )
-                node.children.append(child_node)
+        return flat
 
-        finally:
-            self._visited_stack.discard(target_item)
+    def _select_recipe(
+        self, target_item: str, recipe_selections: dict[str, str]
+    ) -> Recipe | None:
+        """Selected recipe for an item, or the first one that produces it."""
+        selected_recipe_name = recipe_selections.get(target_item)
+        if selected_recipe_name:
+            recipe = self.db.get_recipe(selected_recipe_name)
+            # Verify this recipe actually produces the target item
+            if recipe and recipe.get_output_rate(target_item) > 0:
+                return recipe
 
-        return node
+        return self.db.get_default_recipe(target_item)
+
+    @staticmethod
+    def _copy_subtree(
+        flat: FlatChain,
+        start: int,
+        target_rate: float,
+        parent_index: int,
+        parent_id: Optional[int],
+        path: tuple[str, ...],
+    ) -> ProductionNode:
+        """Append a copy of the finished subtree at start, with fresh ids,
+        rates scaled to target_rate and its root at path; returns the root.
+
+        The subtree is the contiguous slice start..subtree_end[start], so it
+        is copied in one pass with every parent already in place. Each node
+        still gets its own path tuple (the tree view and overrides use it),
+        built from its parent's like the calculator does.
+        """
+        nodes = flat.nodes
+        parents = flat.parent
+        depths = flat.depth
+        subtree_end = flat.subtree_end
+        sources = flat.source
+        scales = flat.scale
+
+        scale = target_rate / nodes[start].target_rate
+        offset = len(nodes) - start  # Index shift from source to copy
+        depth = depths[parent_index] + 1 if parent_index >= 0 else 0
+        depth_shift = depth - depths[start]
+        for index in range(start, subtree_end[start]):
+            source = nodes[index]
+            if index == start:
+                parent = None
+                new_parent_index = parent_index
+            else:
+                new_parent_index = parents[index] + offset
+                parent = nodes[new_parent_index]
+            node = ProductionNode(
+                id=next_node_id(),
+                item_name=source.item_name,
+                recipe_name=source.recipe_name,
+                target_rate=source.target_rate * scale,
+                machine_count=source.machine_count * scale,
+                is_imported=source.is_imported,
+                path=parent.path + (source.item_name,) if parent else path,
+                actual_production_rate=source.actual_production_rate * scale,
+                power_consumption=source.power_consumption * scale,
+                floor_space=source.floor_space * scale,
+                speed_multiplier=source.speed_multiplier,
+                productivity_multiplier=source.productivity_multiplier,
+                parent_id=parent.id if parent else parent_id,
+                children=[] if source.children else NO_CHILDREN,
+            )
+            if parent is not None:
+                parent.children.append(node)
+            nodes.append(node)
+            parents.append(new_parent_index)
+            depths.append(depths[index] + depth_shift)
+            subtree_end.append(subtree_end[index] + offset)
+            sources.append(index)
+            scales.append(scale)
+        return nodes[start + offset]
+
+    def recalculate_incremental(
+        self, chain: BuildChain, dirty_paths: set[tuple[str, ...]]
+    ) -> BuildChain:
+        """Rebuild only the subtrees at dirty_paths after per-node import edits.
+
+        Import overrides only affect the subtree under their own path, so
+        after set_node_import() the rest of the tree is kept; every other
+        setting must be unchanged since the last calculation. The result
+        matches recalculate() apart from the ids of kept nodes. Falls back to
+        a full recalculation when the root itself is dirty.
+
+        The tree keeps its root, so totals cached for it (see
+        ChainAggregator.invalidate) must be dropped by the caller.
+        """
+        flat = chain.flatten()
+        if flat is None or any(len(path) <= 1 for path in dirty_paths):
+            return self.recalculate(chain)
+
+        # Shortest first, so a path inside an already rebuilt subtree is skipped
+        rebuilt: list[tuple[str, ...]] = []
+        for path in sorted(dirty_paths, key=len):
+            if any(path[: len(done)] == done for done in rebuilt):
+                continue
+            # Siblings share a path when a recipe lists an input twice
+            matches = [
+                index for index, node in enumerate(flat.nodes) if node.path == path
+            ]
+            # Highest first, so a splice never shifts a match still to rebuild
+            for index in reversed(matches):
+                self._rebuild_subtree(chain, flat, index)
+            if matches:
+                rebuilt.append(path)
+        return chain
+
+    def _rebuild_subtree(self, chain: BuildChain, flat: FlatChain, index: int) -> None:
+        """Recalculate the subtree at index and splice it into flat in place."""
+        old = flat.nodes[index]
+        parent_index = flat.parent[index]
+        parent = flat.nodes[parent_index]
+        piece = self._build(
+            target_item=old.item_name,
+            target_rate=old.target_rate,
+            recipe_selections=chain.recipe_selections,
+            speed_multipliers=chain.speed_multipliers,
+            productivity_multipliers=chain.productivity_multipliers,
+            imported_items=chain.imported_items,
+            imported_node_overrides=chain.imported_node_overrides,
+            parent_id=parent.id,
+            parent_path=parent.path,
+            ancestors=frozenset(parent.path),
+        )
+        siblings = parent.children
+        for position, child in enumerate(siblings):
+            if child is old:
+                siblings[position] = piece.nodes[0]
+                break
+
+        # Indexes at or past the old subtree's end move by delta; copies made
+        # of the replaced nodes elsewhere become originals (their rates are
+        # already materialized), since their source is gone
+        end = flat.subtree_end[index]
+        delta = len(piece.nodes) - (end - index)
+        depth = flat.depth[index]
+        demoted: list[int] = [index]
+        suffix_source = []
+        suffix_scale = []
+        for position, (origin, scale) in enumerate(
+            zip(flat.source[end:], flat.scale[end:]), start=len(piece.nodes) + index
+        ):
+            if origin >= end:
+                origin += delta
+            elif origin >= index:
+                origin, scale = -1, 1.0
+                demoted.append(position)
+            suffix_source.append(origin)
+            suffix_scale.append(scale)
+
+        flat.nodes[index:end] = piece.nodes
+        flat.parent[index:] = (
+            [parent_index]
+            + [p + index for p in piece.parent[1:]]
+            + [p + delta if p >= end else p for p in flat.parent[end:]]
+        )
+        flat.depth[index:end] = [d + depth for d in piece.depth]
+        flat.subtree_end[:] = (
+            [e + delta if e >= end else e for e in flat.subtree_end[:index]]
+            + [e + index for e in piece.subtree_end]
+            + [e + delta for e in flat.subtree_end[end:]]
+        )
+        flat.source[index:] = [
+            origin + index if origin >= 0 else -1 for origin in piece.source
+        ] + suffix_source
+        flat.scale[index:] = piece.scale + suffix_scale
+
+        # Aggregation skips whole copied subtrees, so no original may sit
+        # below a copy: promote the copied ancestors of anything that changed
+        parents = flat.parent
+        sources = flat.source
+        for position in demoted:
+            ancestor = parents[position]
+            while ancestor >= 0 and sources[ancestor] >= 0:
+                sources[ancestor] = -1
+                flat.scale[ancestor] = 1.0
+                ancestor = parents[ancestor]
 
     def recalculate(self, chain: BuildChain) -> BuildChain:
         """Recalculate entire chain with current settings."""
-        self._visited_stack.clear()
-
-        chain.root_node = self.calculate_chain(
+        chain.flat = self._build(
             target_item=chain.target_item,
             target_rate=chain.target_rate,
             recipe_selections=chain.recipe_selections,
@@ -166,4 +465,5 @@ class DependencyCalculator:
             imported_items=chain.imported_items,
             imported_node_overrides=chain.imported_node_overrides,
         )
+        chain.root_node = chain.flat.nodes[0]
         return chain
@@ -1,7 +1,7 @@
 """Data models for recipes and build chains."""
 
 from .recipe import Recipe, RecipeIO, Building, IOType
-from .build_chain import BuildChain, ProductionNode, AggregatedTotals
+from .build_chain import BuildChain, FlatChain, ProductionNode, AggregatedTotals
 
 __all__ = [
     "Recipe",
@@ -9,6 +9,7 @@ __all__ = [
     "Building",
     "IOType",
     "BuildChain",
+    "FlatChain",
     "ProductionNode",
     "AggregatedTotals",
 ]
@@ -1,15 +1,26 @@
 """Build chain and production node models."""
 
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
+from itertools import count
 from typing import Optional
 from uuid import UUID, uuid4
 
+# Node ids are plain ints, unique within the process: uuid4() per node was a
+# large share of tree-building time and ids are never shared across processes
+next_node_id = count(1).__next__
 
-@dataclass
+# Shared by leaves (most nodes in a wide chain) instead of an empty list each;
+# only nodes that will have children get a list to append to
+NO_CHILDREN: tuple = ()
+
+
+@dataclass(slots=True)
 class ProductionNode:
     """Single production step in a build chain."""
 
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=next_node_id)
     item_name: str = ""
     recipe_name: str = ""  # Selected recipe for this item
     target_rate: float = 0.0  # Desired output rate (items/min)
@@ -25,51 +36,141 @@ class ProductionNode:
     productivity_multiplier: float = 1.0  # Applied productivity (outputs only)
 
     # Tree structure
-    children: list["ProductionNode"] = field(default_factory=list)
-    parent_id: Optional[UUID] = None
+    children: list["ProductionNode"] | tuple = field(default_factory=list)
+    parent_id: Optional[int] = None
 
     def to_dict(self) -> dict:
         """Serialize for JSON storage."""
-        return {
-            "id": str(self.id),
-            "item_name": self.item_name,
-            "recipe_name": self.recipe_name,
-            "target_rate": self.target_rate,
-            "machine_count": self.machine_count,
-            "is_imported": self.is_imported,
-            "path": list(self.path),
-            "actual_production_rate": self.actual_production_rate,
-            "power_consumption": self.power_consumption,
-            "floor_space": self.floor_space,
-            "speed_multiplier": self.speed_multiplier,
-            "productivity_multiplier": self.productivity_multiplier,
-            "children": [c.to_dict() for c in self.children],
-            "parent_id": str(self.parent_id) if self.parent_id else None,
-        }
+        # Iterative so deep chains stay clear of the recursion limit; each
+        # dict is appended to its parent's list as it is reached (pre-order)
+        root = None
+        stack: list[tuple[ProductionNode, list | None]] = [(self, None)]
+        while stack:
+            node, siblings = stack.pop()
+            data = {
+                "id": node.id,
+                "item_name": node.item_name,
+                "recipe_name": node.recipe_name,
+                "target_rate": node.target_rate,
+                "machine_count": node.machine_count,
+                "is_imported": node.is_imported,
+                "path": list(node.path),
+                "actual_production_rate": node.actual_production_rate,
+                "power_consumption": node.power_consumption,
+                "floor_space": node.floor_space,
+                "speed_multiplier": node.speed_multiplier,
+                "productivity_multiplier": node.productivity_multiplier,
+                "children": [],
+                "parent_id": node.parent_id,
+            }
+            if siblings is None:
+                root = data
+            else:
+                siblings.append(data)
+            # Reversed so children are reached, and appended, in order
+            children = data["children"]
+            for child in reversed(node.children):
+                stack.append((child, children))
+        return root
 
     @classmethod
     def from_dict(cls, data: dict) -> "ProductionNode":
-        """Deserialize from JSON."""
-        node = cls(
-            id=UUID(data["id"]),
-            item_name=data["item_name"],
-            recipe_name=data.get("recipe_name", ""),
-            target_rate=data.get("target_rate", 0.0),
-            machine_count=data.get("machine_count", 0.0),
-            is_imported=data.get("is_imported", False),
-            path=tuple(data.get("path", [])),
-            actual_production_rate=data.get("actual_production_rate", 0.0),
-            power_consumption=data.get("power_consumption", 0.0),
-            floor_space=data.get("floor_space", 0.0),
-            speed_multiplier=data.get("speed_multiplier", 1.0),
-            productivity_multiplier=data.get("productivity_multiplier", 1.0),
-            parent_id=UUID(data["parent_id"]) if data.get("parent_id") else None,
-        )
-        node.children = [cls.from_dict(c) for c in data.get("children", [])]
-        return node
+        """Deserialize from JSON.
+
+        Nodes get fresh ids (stored ones may be UUIDs from older saves, or
+        clash with ids issued since); parent links follow the tree itself.
+        """
+        root = None
+        stack: list[tuple[dict, ProductionNode | None]] = [(data, None)]
+        while stack:
+            item, parent = stack.pop()
+            node = cls(
+                item_name=item["item_name"],
+                recipe_name=item.get("recipe_name", ""),
+                target_rate=item.get("target_rate", 0.0),
+                machine_count=item.get("machine_count", 0.0),
+                is_imported=item.get("is_imported", False),
+                path=tuple(item.get("path", [])),
+                actual_production_rate=item.get("actual_production_rate", 0.0),
+                power_consumption=item.get("power_consumption", 0.0),
+                floor_space=item.get("floor_space", 0.0),
+                speed_multiplier=item.get("speed_multiplier", 1.0),
+                productivity_multiplier=item.get("productivity_multiplier", 1.0),
+                parent_id=parent.id if parent else None,
+                children=[] if item.get("children") else NO_CHILDREN,
+            )
+            if parent is None:
+                root = node
+            else:
+                parent.children.append(node)
+            for child in reversed(item.get("children", [])):
+                stack.append((child, node))
+        return root
+
+
+@dataclass(slots=True)
+class FlatChain:
+    """Production tree laid out in pre-order as parallel lists.
+
+    Node i's subtree spans indices i to subtree_end[i] - 1, so walks can skip
+    a whole branch by jumping ahead instead of popping a stack.
+
+    Repeated subtrees are materialized as scaled copies (the tree view needs
+    every node), but source/scale remember where each copied node came from,
+    so totals can be summed over original nodes only, each weighted by its
+    multiplicity().
+    """
+
+    nodes: list[ProductionNode] = field(default_factory=list)
+    parent: list[int] = field(default_factory=list)  # Index of parent, -1 for root
+    depth: list[int] = field(default_factory=list)
+    subtree_end: list[int] = field(default_factory=list)
+    source: list[int] = field(default_factory=list)  # Node copied from, -1 if original
+    scale: list[float] = field(default_factory=list)  # Copy's rates / source's rates
 
-
-@dataclass
+    @classmethod
+    def from_tree(cls, root: ProductionNode) -> "FlatChain":
+        """Flatten a linked tree (e.g. one loaded from JSON)."""
+        flat = cls()
+        stack = [(root, -1, 0)]
+        while stack:
+            node, parent, depth = stack.pop()
+            index = len(flat.nodes)
+            flat.nodes.append(node)
+            flat.parent.append(parent)
+            flat.depth.append(depth)
+            flat.subtree_end.append(index + 1)
+            flat.source.append(-1)
+            flat.scale.append(1.0)
+            for child in reversed(node.children):
+                stack.append((child, index, depth + 1))
+
+        # Children follow their parent, so one reverse pass settles every end
+        ends = flat.subtree_end
+        for index in range(len(ends) - 1, 0, -1):
+            parent = flat.parent[index]
+            if ends[index] > ends[parent]:
+                ends[parent] = ends[index]
+        return flat
+
+    def multiplicity(self) -> list[float]:
+        """Per node: 1 plus the scale of every copy made of it, recursively.
+
+        An original node's rates times its multiplicity equal the sum over it
+        and all its copies. Copies always come after their source, so a
+        single reverse pass settles copies of copies first.
+        """
+        weights = [1.0] * len(self.nodes)
+        source = self.source
+        scale = self.scale
+        for index in range(len(weights) - 1, 0, -1):
+            origin = source[index]
+            if origin >= 0:
+                weights[origin] += scale[index] * weights[index]
+        return weights
+
+
+@dataclass(slots=True)
 class BuildChain:
     """Complete build chain configuration."""
 
@@ -101,6 +202,17 @@ class BuildChain:
     created_at: str = ""
     updated_at: str = ""
 
+    # Pre-order layout of root_node, filled by the calculator (not serialized)
+    flat: Optional[FlatChain] = field(default=None, repr=False, compare=False)
+
+    def flatten(self) -> Optional[FlatChain]:
+        """Flat layout of the current tree, rebuilt if root_node has changed."""
+        if self.root_node is None:
+            return None
+        if self.flat is None or self.flat.nodes[0] is not self.root_node:
+            self.flat = FlatChain.from_tree(self.root_node)
+        return self.flat
+
     def is_path_imported(self, path: tuple[str, ...]) -> bool:
         """Check if a node path should be imported (considering overrides)."""
         if path in self.imported_node_overrides:
@@ -153,19 +265,33 @@ class BuildChain:
 
     @classmethod
     def from_dict(cls, data: dict) -> "BuildChain":
-        """Deserialize from JSON."""
+        """Deserialize from JSON.
+
+        Item and recipe names are interned to match the recipe database's, so
+        the calculator's lookups with them compare by identity.
+        """
+        intern = sys.intern
         chain = cls(
             id=UUID(data["id"]),
             name=data["name"],
             description=data.get("description", ""),
-            target_item=data["target_item"],
+            target_item=intern(data["target_item"]),
             target_rate=data["target_rate"],
-            recipe_selections=data.get("recipe_selections", {}),
-            speed_multipliers=data.get("speed_multipliers", {}),
-            productivity_multipliers=data.get("productivity_multipliers", {}),
-            imported_items=set(data.get("imported_items", [])),
+            recipe_selections={
+                intern(item): intern(recipe)
+                for item, recipe in data.get("recipe_selections", {}).items()
+            },
+            speed_multipliers={
+                intern(recipe): value
+                for recipe, value in data.get("speed_multipliers", {}).items()
+            },
+            productivity_multipliers={
+                intern(recipe): value
+                for recipe, value in data.get("productivity_multipliers", {}).items()
+            },
+            imported_items=set(map(intern, data.get("imported_items", []))),
             imported_node_overrides={
-                tuple(key.split("|")): val
+                tuple(map(intern, key.split("|"))): val
                 for key, val in data.get("imported_node_overrides", {}).items()
             },
             created_at=data.get("created_at", ""),
@@ -176,24 +302,38 @@ class BuildChain:
         return chain
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedTotals:
     """Summary of a build chain's resource requirements."""
 
     # Item -> gross production (total made, items/min)
-    gross_production: dict[str, float] = field(default_factory=dict)
+    gross_production: dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
 
     # Item -> gross consumption (total used internally, items/min)
-    gross_consumption: dict[str, float] = field(default_factory=dict)
+    gross_consumption: dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
 
     # Item -> net balance (production - consumption, negative = needs import)
     net_balance: dict[str, float] = field(default_factory=dict)
 
     # Building type -> count (totals)
-    machine_counts: dict[str, float] = field(default_factory=dict)
+    machine_counts: dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
 
     # (Building type, recipe name) -> count (detailed breakdown)
-    machine_counts_by_recipe: dict[tuple[str, str], float] = field(default_factory=dict)
+    machine_counts_by_recipe: dict[tuple[str, str], float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
+    # The same breakdown ready for display: (building, [(recipe, count)]) by
+    # building name, each building's recipes by descending count
+    machine_counts_grouped: list[tuple[str, list[tuple[str, float]]]] = field(
+        default_factory=list
+    )
 
     # Total power consumption (MW), can be negative if net producer
     total_power: float = 0.0
@@ -4,57 +4,76 @@ from enum import Enum
 
 
 class GameMode(Enum):
-    """Supported games."""
+    """Supported games.
 
-    SATISFACTORY = "satisfactory"
-    FACTORIO = "factorio"
-    DSP = "dsp"
-    FOUNDRY = "foundry"
+    Each member's settings are fixed at definition, so they are stored as
+    plain attributes rather than recomputed by comparing members.
+    """
 
-    @property
-    def display_name(self) -> str:
-        if self == GameMode.DSP:
-            return "Dyson Sphere Program"
-        return self.value.capitalize()
+    display_name: str
+    recipe_file: str
+    save_folder: str
+    background_color: str
+    has_power: bool
+    has_floor_space: bool
+    has_buildings: bool
+    has_productivity: bool
 
-    @property
-    def recipe_file(self) -> str:
-        if self == GameMode.SATISFACTORY:
-            return "recipes.tsv"
-        elif self == GameMode.FACTORIO:
-            return "recipes_factorio.tsv"
-        elif self == GameMode.FOUNDRY:
-            return "recipes_foundry.tsv"
-        return "recipes_dsp.tsv"
+    # (value, display name, recipe file, background color,
+    #  has power/floor space/buildings, has productivity)
+    SATISFACTORY = (
+        "satisfactory",
+        "Satisfactory",
+        "recipes.tsv",
+        "#0a1628",  # Dark blue
+        True,
+        False,
+    )
+    # Factorio has productivity modules, DSP has proliferator
+    FACTORIO = (
+        "factorio",
+        "Factorio",
+        "recipes_factorio.tsv",
+        "#1a0a28",  # Deep purple
+        False,
+        True,
+    )
+    DSP = (
+        "dsp",
+        "Dyson Sphere Program",
+        "recipes_dsp.tsv",
+        "#1a1a1a",  # Very dark gray
+        False,
+        True,
+    )
+    # Foundry doesn't have productivity bonuses
+    FOUNDRY = (
+        "foundry",
+        "Foundry",
+        "recipes_foundry.tsv",
+        "#1a2810",  # Dark olive/green
+        False,
+        False,
+    )
 
-    @property
-    def save_folder(self) -> str:
-        return self.value
-
-    @property
-    def has_power(self) -> bool:
-        return self == GameMode.SATISFACTORY
-
-    @property
-    def has_floor_space(self) -> bool:
-        return self == GameMode.SATISFACTORY
-
-    @property
-    def has_buildings(self) -> bool:
-        return self == GameMode.SATISFACTORY
-
-    @property
-    def has_productivity(self) -> bool:
-        # Factorio has productivity modules, DSP has proliferator
-        # Foundry doesn't have productivity bonuses
-        return self in (GameMode.FACTORIO, GameMode.DSP)
-
-    @property
-    def background_color(self) -> str:
-        if self == GameMode.SATISFACTORY:
-            return "#0a1628"  # Dark blue
-        elif self == GameMode.FACTORIO:
-            return "#1a0a28"  # Deep purple
-        elif self == GameMode.FOUNDRY:
-            return "#1a2810"  # Dark olive/green for Foundry
-        return "#1a1a1a"  # Very dark gray for DSP
+    def __new__(
+        cls,
+        value: str,
+        display_name: str,
+        recipe_file: str,
+        background_color: str,
+        has_buildings: bool,
+        has_productivity: bool,
+    ) -> "GameMode":
+        member = object.__new__(cls)
+        member._value_ = value
+        member.display_name = display_name
+        member.recipe_file = recipe_file
+        member.save_folder = value
+        member.background_color = background_color
+        # Power and floor space both come from per-building data
+        member.has_power = has_buildings
+        member.has_floor_space = has_buildings
+        member.has_buildings = has_buildings
+        member.has_productivity = has_productivity
+        return member
@@ -1,7 +1,8 @@
 """Recipe and building data models."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from typing import NamedTuple
 
 
 class IOType(Enum):
@@ -11,7 +12,7 @@ class IOType(Enum):
     OUTPUT = "output"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Building:
     """Represents a production building type."""
 
@@ -20,16 +21,19 @@ class Building:
     floor_space: float  # Size in units
 
 
-@dataclass(frozen=True)
-class RecipeIO:
-    """Single input or output of a recipe."""
+class RecipeIO(NamedTuple):
+    """Single input or output of a recipe.
+
+    A NamedTuple rather than a frozen dataclass: loaders build one per TSV
+    row, and tuple construction skips the per-field frozen __setattr__.
+    """
 
     item_name: str
     amount: float  # Positive for output, negative for input (absolute stored)
     io_type: IOType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Recipe:
     """Complete recipe with all inputs and outputs."""
 
@@ -39,33 +43,83 @@ class Recipe:
     inputs: tuple[RecipeIO, ...]  # Frozen for hashability
     outputs: tuple[RecipeIO, ...]  # May have multiple (byproducts)
 
-    @property
-    def cycles_per_minute(self) -> float:
-        """Calculate cycles per minute based on runtime."""
-        if self.runtime <= 0:
-            return 0.0
-        return 60.0 / self.runtime
+    # Derived once in __post_init__; recipes are immutable
+    cycles_per_minute: float = field(init=False, repr=False, compare=False)
+    primary_output: str = field(init=False, repr=False, compare=False)
+
+    # Precomputed (item_name, items/min) pairs for one machine at 100% speed
+    input_rates: tuple[tuple[str, float], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    output_rates: tuple[tuple[str, float], ...] = field(
+        init=False, repr=False, compare=False
+    )  # Excludes power (MW), which is tracked separately
+    # One pair per input, in order, as the calculator expands them; unlike
+    # input_rates, a repeated item takes its first amount (as get_input_rate)
+    child_input_rates: tuple[tuple[str, float], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    # Lookup tables behind get_input_rate/get_output_rate (outputs include MW)
+    _input_rates: dict[str, float] = field(init=False, repr=False, compare=False)
+    _output_rates: dict[str, float] = field(init=False, repr=False, compare=False)
+    _is_power_generator: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass, so bypass __setattr__ for derived fields
+        cycles = 60.0 / self.runtime if self.runtime > 0 else 0.0
+        object.__setattr__(self, "cycles_per_minute", cycles)
+        # The item this recipe is primarily named for (largest output)
+        object.__setattr__(
+            self,
+            "primary_output",
+            max(self.outputs, key=lambda o: o.amount).item_name if self.outputs else "",
+        )
+        object.__setattr__(
+            self,
+            "input_rates",
+            tuple((io.item_name, io.amount * cycles) for io in self.inputs),
+        )
+        object.__setattr__(
+            self,
+            "output_rates",
+            tuple(
+                (io.item_name, io.amount * cycles)
+                for io in self.outputs
+                if io.item_name != "MW"
+            ),
+        )
+        # Built in reverse so a repeated item keeps its first amount, as the
+        # linear scans these replace did
+        object.__setattr__(
+            self,
+            "_input_rates",
+            {io.item_name: io.amount * cycles for io in reversed(self.inputs)},
+        )
+        object.__setattr__(
+            self,
+            "_output_rates",
+            {io.item_name: io.amount * cycles for io in reversed(self.outputs)},
+        )
+        object.__setattr__(
+            self,
+            "child_input_rates",
+            tuple((io.item_name, self._input_rates[io.item_name]) for io in self.inputs),
+        )
+        object.__setattr__(self, "_is_power_generator", "MW" in self._output_rates)
 
     def get_input_rate(self, item_name: str) -> float:
         """Get consumption rate (items/min) for an input item."""
-        for io in self.inputs:
-            if io.item_name == item_name:
-                return io.amount * self.cycles_per_minute
-        return 0.0
+        return self._input_rates.get(item_name, 0.0)
 
     def get_output_rate(self, item_name: str) -> float:
         """Get production rate (items/min) for an output item."""
-        for io in self.outputs:
-            if io.item_name == item_name:
-                return io.amount * self.cycles_per_minute
-        return 0.0
+        return self._output_rates.get(item_name, 0.0)
 
     def get_primary_output(self) -> str:
         """Returns the item this recipe is primarily named for (largest output)."""
-        if not self.outputs:
-            return ""
-        return max(self.outputs, key=lambda o: o.amount).item_name
+        return self.primary_output
 
     def is_power_generator(self) -> bool:
         """Check if recipe produces power (MW output)."""
-        return any(o.item_name == "MW" for o in self.outputs)
+        return self._is_power_generator
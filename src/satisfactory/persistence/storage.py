@@ -1,12 +1,79 @@
 """JSON storage for build chains."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from satisfactory.models.build_chain import BuildChain
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is a slower fallback
+    orjson = None
+
+# Chain files stay indented so they remain readable and diffable; the stdlib
+# fallback reuses one configured encoder instead of building one per save
+_CHAIN_JSON_OPTIONS = orjson.OPT_INDENT_2 if orjson else 0
+_CHAIN_ENCODER = json.JSONEncoder(indent=2)
+
+
+# ASCII filename sanitizer: letters, digits, "-" and "_" kept, the rest "_"
+_SAFE_ASCII = {
+    ord(c): c if c.isalnum() or c in "-_" else "_" for c in map(chr, range(128))
+}
+
+
+def _safe_filename(name: str) -> str:
+    """Sanitize a chain name for use in a filename."""
+    if name.isascii():
+        return name.translate(_SAFE_ASCII)
+    # Unicode letters and digits are kept too
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+
+
+def _meta_path(filepath: Path) -> Path:
+    """Header sidecar of a chain file; not matched by the *.json glob."""
+    return filepath.with_name(filepath.name + ".meta")
+
+
+def _write_meta(filepath: Path, data: dict) -> None:
+    """Store the fields list_chains needs next to a chain file (best effort).
+
+    The chain file's mtime and size are recorded so an edit made without
+    going through save() makes the header stale rather than wrong.
+    """
+    try:
+        stat = filepath.stat()
+        meta = {
+            "source_mtime_ns": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "name": data.get("name", "Unnamed"),
+            "target_item": data.get("target_item", ""),
+            "target_rate": data.get("target_rate", 0.0),
+        }
+        encoded = orjson.dumps(meta) if orjson else json.dumps(meta).encode("utf-8")
+        _meta_path(filepath).write_bytes(encoded)
+    except OSError:
+        pass  # Listing falls back to reading the chain file
+
+
+def _read_meta(filepath: Path, mtime_ns: int, size: int) -> dict | None:
+    """Header for a chain file, or None if missing or stale."""
+    try:
+        raw = _meta_path(filepath).read_bytes()
+        meta = orjson.loads(raw) if orjson else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(meta, dict)
+        or meta.get("source_mtime_ns") != mtime_ns
+        or meta.get("source_size") != size
+    ):
+        return None
+    return meta
+
 
 class ChainStorage:
     """Handles saving/loading build chains to JSON files."""
@@ -14,6 +81,11 @@ class ChainStorage:
     def __init__(self, storage_dir: Path):
         self.storage_dir = storage_dir
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        # list_chains entries by file path, with the (mtime_ns, size) they were
+        # read at; lets reruns skip decoding files that have not changed
+        self._list_cache: dict[
+            str, tuple[int, int, tuple[Path, str, str, float]]
+        ] = {}
 
     def save(self, chain: BuildChain, filename: Optional[str] = None) -> Path:
         """Save chain to JSON file."""
@@ -22,46 +94,91 @@ class ChainStorage:
             chain.created_at = chain.updated_at
 
         if not filename:
-            # Sanitize chain name for filename
-            safe_name = "".join(
-                c if c.isalnum() or c in "-_" else "_" for c in chain.name
-            )
-            filename = f"{safe_name}_{chain.id}.json"
+            filename = f"{_safe_filename(chain.name)}_{chain.id}.json"
 
         filepath = self.storage_dir / filename
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(chain.to_dict(), f, indent=2)
+        # Encoded in one go and written with a single call
+        data = chain.to_dict()
+        if orjson:
+            encoded = orjson.dumps(data, option=_CHAIN_JSON_OPTIONS)
+        else:
+            encoded = _CHAIN_ENCODER.encode(data).encode("utf-8")
+        filepath.write_bytes(encoded)
+        _write_meta(filepath, data)
+        self._list_cache.pop(os.fspath(filepath), None)
 
         return filepath
 
     def load(self, filepath: Path) -> BuildChain:
         """Load chain from JSON file."""
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = filepath.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         return BuildChain.from_dict(data)
 
     def list_chains(self) -> list[tuple[Path, str, str, float]]:
         """List all saved chains as (path, name, target_item, target_rate)."""
         chains = []
-        for filepath in self.storage_dir.glob("*.json"):
-            try:
-                with open(filepath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                chains.append(
-                    (
-                        filepath,
-                        data.get("name", "Unnamed"),
-                        data.get("target_item", ""),
-                        data.get("target_rate", 0.0),
+        seen = set()
+        # scandir rather than glob: unchanged files then cost a stat and a
+        # dict lookup, with no Path built for them
+        with os.scandir(self.storage_dir) as entries:
+            for dir_entry in entries:
+                if not dir_entry.name.endswith(".json") or not dir_entry.is_file():
+                    continue
+                try:
+                    stat = dir_entry.stat()
+                except OSError:
+                    continue  # Removed since the scan
+                seen.add(dir_entry.path)
+                cached = self._list_cache.get(dir_entry.path)
+                if cached is not None and cached[:2] == (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ):
+                    chains.append(cached[2])
+                    continue
+                entry = self._read_listing(Path(dir_entry.path), stat)
+                if entry is not None:
+                    self._list_cache[dir_entry.path] = (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        entry,
                     )
-                )
-            except (json.JSONDecodeError, KeyError):
-                continue
+                    chains.append(entry)
+
+        # Forget files that are gone
+        for path in self._list_cache.keys() - seen:
+            del self._list_cache[path]
         return chains
 
+    @staticmethod
+    def _read_listing(
+        filepath: Path, stat: os.stat_result
+    ) -> tuple[Path, str, str, float] | None:
+        """(path, name, target_item, target_rate) for a chain file, or None."""
+        # The header sidecar spares decoding the whole node tree; chains
+        # saved before it existed (or edited by hand) get one written
+        data = _read_meta(filepath, stat.st_mtime_ns, stat.st_size)
+        if data is None:
+            try:
+                raw = filepath.read_bytes()
+                # orjson.JSONDecodeError subclasses json's
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+            except (json.JSONDecodeError, KeyError):
+                return None
+            _write_meta(filepath, data)
+        return (
+            filepath,
+            data.get("name", "Unnamed"),
+            data.get("target_item", ""),
+            data.get("target_rate", 0.0),
+        )
+
     def delete(self, filepath: Path) -> bool:
         """Delete a saved chain."""
+        self._list_cache.pop(os.fspath(filepath), None)
+        _meta_path(filepath).unlink(missing_ok=True)
         try:
             filepath.unlink()
             return True
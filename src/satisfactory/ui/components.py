@@ -29,7 +29,12 @@ _COMPACT_DROPDOWN_CSS = """
 
 def _get_default_chain_name(target_item: str, storage) -> str:
     """Generate default chain name like 'Product 1', 'Product 2', etc."""
-    existing_names = {name for _, name, _, _ in storage.list_chains()}
+    # Saved names are kept in session state (reset whenever chains are saved
+    # or deleted) so choosing a default doesn't rescan storage every rerun
+    existing_names = st.session_state.get("chain_names_cache")
+    if existing_names is None:
+        existing_names = {name for _, name, _, _ in storage.list_chains()}
+        st.session_state.chain_names_cache = existing_names
     suffix = 1
     while f"{target_item} {suffix}" in existing_names:
         suffix += 1
@@ -109,6 +114,7 @@ def render_sidebar():
         selected_path = chain_options[selected_label]
         if selected_path and st.button("Delete Selected", key="delete_selected"):
             storage.delete(selected_path)
+            st.session_state.chain_names_cache = None
             st.session_state.widget_key_version += 1
             st.rerun()
 
@@ -137,32 +143,38 @@ def render_sidebar():
     # New/Edit chain section
     st.subheader("Configure Chain")
 
-    producible_items = sorted(db.get_producible_items())
+    producible_items = db.get_sorted_producible_items()
 
     # Determine default values from current chain or defaults
-    if st.session_state.prev_target_item and st.session_state.prev_target_item in producible_items:
-        default_item_idx = producible_items.index(st.session_state.prev_target_item)
-    else:
-        default_item_idx = 0
+    default_item_idx = 0
+    if st.session_state.prev_target_item:
+        default_item_idx = (
+            db.get_producible_item_index(st.session_state.prev_target_item) or 0
+        )
 
     default_rate = st.session_state.prev_target_rate or 10.0
 
-    # Target product selection
-    target_item = st.selectbox(
-        "Target Product",
-        options=producible_items,
-        index=default_item_idx,
-        key=f"target_item_select_{st.session_state.widget_key_version}",
-    )
+    # Target and rate sit in a form, so their values only change (and the
+    # chain is only recalculated) when Apply is pressed, not on every step
+    with st.form("chain_config", border=False):
+        # Target product selection
+        target_item = st.selectbox(
+            "Target Product",
+            options=producible_items,
+            index=default_item_idx,
+            key=f"target_item_select_{st.session_state.widget_key_version}",
+        )
 
-    # Target rate
-    target_rate = st.number_input(
-        "Output Rate (items/min)",
-        min_value=0.1,
-        value=float(default_rate),
-        step=1.0,
-        key=f"target_rate_input_{st.session_state.widget_key_version}",
-    )
+        # Target rate
+        target_rate = st.number_input(
+            "Output Rate (items/min)",
+            min_value=0.1,
+            value=float(default_rate),
+            step=1.0,
+            key=f"target_rate_input_{st.session_state.widget_key_version}",
+        )
+
+        st.form_submit_button("Apply")
 
     # Detect if target item changed - reset chain name and force widget refresh
     target_item_changed = target_item != st.session_state.prev_target_item
@@ -208,6 +220,7 @@ def render_sidebar():
     if st.session_state.current_chain:
         if st.button("Save Current Chain"):
             storage.save(st.session_state.current_chain)
+            st.session_state.chain_names_cache = None
             st.session_state.widget_key_version += 1
             st.success("Saved!")
             st.rerun()
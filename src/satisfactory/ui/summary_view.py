@@ -42,7 +42,10 @@ def render_summary():
     # Item balance table
     st.subheader("📦 Item Balance")
 
-    balance_data = []
+    # Tables are built column by column: cheaper for pandas than row dicts
+    balance_data: dict[str, list[str]] = {
+        "Item": [], "Produced": [], "Consumed": [], "Net": [], "Status": []
+    }
     for item in sorted(totals.net_balance.keys()):
         prod = totals.gross_production.get(item, 0)
         cons = totals.gross_consumption.get(item, 0)
@@ -55,17 +58,13 @@ def render_summary():
         else:
             status = "⚖️ Balanced"
 
-        balance_data.append(
-            {
-                "Item": item,
-                "Produced": f"{prod:.2f}/min",
-                "Consumed": f"{cons:.2f}/min",
-                "Net": f"{net:+.2f}/min",
-                "Status": status,
-            }
-        )
+        balance_data["Item"].append(item)
+        balance_data["Produced"].append(f"{prod:.2f}/min")
+        balance_data["Consumed"].append(f"{cons:.2f}/min")
+        balance_data["Net"].append(f"{net:+.2f}/min")
+        balance_data["Status"].append(status)
 
-    if balance_data:
+    if balance_data["Item"]:
         df = pd.DataFrame(balance_data)
         st.dataframe(df, width="stretch", hide_index=True)
     else:
@@ -76,35 +75,25 @@ def render_summary():
     # Machine counts by recipe with subtotals
     st.subheader("🏭 Machine Requirements")
 
-    if totals.machine_counts_by_recipe:
-        # Group by building type
-        from collections import defaultdict
-        by_building: dict[str, list[tuple[str, float]]] = defaultdict(list)
-        for (building, recipe), count in totals.machine_counts_by_recipe.items():
-            by_building[building].append((recipe, count))
-
-        machine_data = []
-        for building in sorted(by_building.keys()):
-            recipes = by_building[building]
-            # Sort recipes by count descending
-            recipes.sort(key=lambda x: -x[1])
-
+    if totals.machine_counts_grouped:
+        # Grouped by building, recipes by descending count (done by the
+        # aggregator, once per chain)
+        machine_data: dict[str, list[str]] = {
+            "Building": [], "Recipe": [], "Count": [], "Whole": []
+        }
+        for building, recipes in totals.machine_counts_grouped:
             for recipe, count in recipes:
-                machine_data.append({
-                    "Building": building,
-                    "Recipe": recipe,
-                    "Count": f"{count:.2f}",
-                    "Whole": str(math.ceil(count)),
-                })
+                machine_data["Building"].append(building)
+                machine_data["Recipe"].append(recipe)
+                machine_data["Count"].append(f"{count:.2f}")
+                machine_data["Whole"].append(str(math.ceil(count)))
 
             # Add subtotal row
             subtotal = totals.machine_counts[building]
-            machine_data.append({
-                "Building": f"{building} TOTAL",
-                "Recipe": "---",
-                "Count": f"{subtotal:.2f}",
-                "Whole": str(math.ceil(subtotal)),
-            })
+            machine_data["Building"].append(f"{building} TOTAL")
+            machine_data["Recipe"].append("---")
+            machine_data["Count"].append(f"{subtotal:.2f}")
+            machine_data["Whole"].append(str(math.ceil(subtotal)))
 
         st.dataframe(
             pd.DataFrame(machine_data), width="stretch", hide_index=True
@@ -118,10 +107,11 @@ def render_summary():
     st.subheader("🪨 Base Resources Required")
 
     if totals.base_resources:
-        resource_data = [
-            {"Resource": item, "Rate": f"{rate:.2f}/min"}
-            for item, rate in sorted(totals.base_resources.items())
-        ]
+        resources = sorted(totals.base_resources.items())
+        resource_data = {
+            "Resource": [item for item, _ in resources],
+            "Rate": [f"{rate:.2f}/min" for _, rate in resources],
+        }
         st.dataframe(
             pd.DataFrame(resource_data), width="stretch", hide_index=True
         )
@@ -129,6 +119,28 @@ def render_summary():
         st.success("No external resources needed - fully self-sufficient!")
 
 
+def _load_recalculated(path):
+    """Load and recalculate a saved chain, reusing it while the file is unchanged.
+
+    Kept per session (reset on game mode switch, which swaps the calculator),
+    keyed by path with the file's mtime and size; the same chain objects also
+    keep hitting the aggregator's per-tree cache.
+    """
+    cache = st.session_state.get("combine_chain_cache")
+    if cache is None:
+        cache = st.session_state.combine_chain_cache = {}
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    chain = st.session_state.calculator.recalculate(
+        st.session_state.storage.load(path)
+    )
+    cache[path] = (version, chain)
+    return chain
+
+
 def render_combine_tab():
     """Render the combine chains tab."""
     st.subheader("🔗 Combine Build Chains")
@@ -190,9 +202,8 @@ def render_combine_tab():
         if st.button("Calculate Combined Totals", type="primary"):
             chains_with_multipliers = []
             for path, mult in st.session_state.combine_selections:
-                chain = storage.load(path)
-                # Recalculate to ensure consistency
-                chain = st.session_state.calculator.recalculate(chain)
+                # Recalculated to ensure consistency
+                chain = _load_recalculated(path)
                 chains_with_multipliers.append((chain, mult))
 
             combined_totals = st.session_state.aggregator.combine_chains(
@@ -235,15 +246,14 @@ def render_combine_tab():
 
             # Net balance
             st.write("**Net Balance:**")
-            balance_data = []
+            balance_data: dict[str, list[str]] = {"Item": [], "Net": [], "Status": []}
             for item in sorted(combined_totals.net_balance.keys()):
                 net = combined_totals.net_balance[item]
                 if abs(net) > 0.01:
-                    status = "Surplus" if net > 0 else "Deficit"
-                    balance_data.append(
-                        {"Item": item, "Net": f"{net:+.2f}/min", "Status": status}
-                    )
-            if balance_data:
+                    balance_data["Item"].append(item)
+                    balance_data["Net"].append(f"{net:+.2f}/min")
+                    balance_data["Status"].append("Surplus" if net > 0 else "Deficit")
+            if balance_data["Item"]:
                 st.dataframe(
                     pd.DataFrame(balance_data),
                     width="stretch",
@@ -274,6 +284,7 @@ def render_combine_tab():
                     combined_chain
                 )
                 storage.save(combined_chain)
+                st.session_state.chain_names_cache = None
                 st.success(f"Saved '{new_name}'!")
                 st.session_state.combine_selections = []
                 st.rerun()
@@ -1,33 +1,22 @@
 """Hierarchical dependency tree display with integrated recipe selection."""
 
+import pandas as pd
 import streamlit as st
 
 from satisfactory.models.build_chain import ProductionNode
 from satisfactory.models.game_mode import GameMode
 
-# Tight column layout CSS
-_TIGHT_COLUMNS_CSS = """
-<style>
-    /* Reduce gap between columns in the tree view */
-    div[data-testid="column"] {
-        padding-left: 0.2rem !important;
-        padding-right: 0.2rem !important;
-    }
-    /* Make checkbox and button columns minimal width */
-    div[data-testid="column"]:has(> div > div > div > input[type="checkbox"]),
-    div[data-testid="column"]:has(> div > div > button) {
-        flex: 0 0 2.5rem !important;
-        min-width: 2.5rem !important;
-    }
-</style>
-"""
+# Indent per tree level in the Item column (non-breaking, so it isn't trimmed)
+_INDENT = "\u00a0" * 4
 
 
 def render_dependency_tree():
-    """Render hierarchical dependency tree with integrated recipe controls."""
-    # Inject CSS for tighter column layout
-    st.markdown(_TIGHT_COLUMNS_CSS, unsafe_allow_html=True)
+    """Render hierarchical dependency tree with integrated recipe controls.
 
+    The whole tree is one st.data_editor grid, a row per node in tree order,
+    instead of a set of widgets per node; edits are found by comparing the
+    returned grid with the rows it was given.
+    """
     chain = st.session_state.current_chain
     if not chain or not chain.root_node:
         st.info("Create a build chain to see the dependency tree")
@@ -36,164 +25,191 @@ def render_dependency_tree():
     st.subheader(f"Build Chain: {chain.name}")
     st.caption(f"Target: {chain.target_rate:.2f} {chain.target_item}/min")
 
-    # Track if any changes were made
-    if "tree_changed" not in st.session_state:
-        st.session_state.tree_changed = False
+    # Edits rejected on the previous run; the grid was reset when they were
+    rejected = st.session_state.pop("tree_edit_rejections", None)
+    if rejected:
+        st.warning("\n\n".join(rejected))
 
-    # Render tree with integrated controls
-    _render_node_with_controls(chain.root_node, chain, depth=0)
-
-    # Apply changes if any were made
-    if st.session_state.tree_changed:
-        st.session_state.tree_changed = False
-        st.session_state.current_chain = st.session_state.calculator.recalculate(
-            chain
+    db = st.session_state.db
+    has_productivity = st.session_state.game_mode.has_productivity
+
+    flat = chain.flatten()
+    # Bound once for the row loop; the import check is is_path_imported inlined
+    overrides = chain.imported_node_overrides
+    imported_items = chain.imported_items
+    speed_multipliers = chain.speed_multipliers
+    productivity_multipliers = chain.productivity_multipliers
+    get_recipes = db.get_recipes_for_item
+    recipe_options: set[str] = set()
+    rows = []
+    for node, depth in zip(flat.nodes, flat.depth):
+        recipes = get_recipes(node.item_name)
+        if recipes:
+            recipe_options.update(r.name for r in recipes)
+        imported = overrides.get(node.path)
+        if imported is None:
+            imported = node.item_name in imported_items
+        producing = bool(recipes) and not imported
+        if not recipes:
+            status = f"{node.target_rate:.2f}/min needed"
+        elif producing:
+            status = f"🏭 {node.machine_count:.2f}x"
+        else:
+            status = f"📦 import {node.target_rate:.2f}/min"
+        rows.append(
+            {
+                "Item": _INDENT * depth + node.item_name,
+                "Import": not producing,
+                "All": False,
+                "Status": status,
+                "Recipe": node.recipe_name if producing else None,
+                "Speed": speed_multipliers.get(node.recipe_name, 1.0)
+                if producing
+                else None,
+                "Productivity": productivity_multipliers.get(node.recipe_name, 1.0)
+                if producing
+                else None,
+            }
         )
-        st.rerun()
 
+    df = pd.DataFrame(rows)
+    if not has_productivity:
+        df = df.drop(columns="Productivity")
+
+    editor_version = st.session_state.get("tree_editor_version", 0)
+
+    edited = st.data_editor(
+        df,
+        column_config={
+            "Import": st.column_config.CheckboxColumn(
+                "Import", help="Import this item here instead of producing it"
+            ),
+            "All": st.column_config.CheckboxColumn(
+                "∀", help="Flip import/produce for ALL of this item"
+            ),
+            "Recipe": st.column_config.SelectboxColumn(
+                "Recipe", options=sorted(recipe_options)
+            ),
+            "Speed": st.column_config.NumberColumn(
+                "Speed",
+                help="Speed multiplier",
+                min_value=0.01,
+                max_value=10.0,
+                step=0.25,
+                format="%.2f",
+            ),
+            "Productivity": st.column_config.NumberColumn(
+                "Productivity",
+                help="Productivity multiplier (outputs only)",
+                min_value=1.0,
+                max_value=5.0,
+                step=0.1,
+                format="%.2f",
+            ),
+        },
+        disabled=["Item", "Status"],
+        hide_index=True,
+        width="stretch",
+        num_rows="fixed",
+        # Sidebar resets (chain loads, new targets) start a clean grid too
+        key=f"tree_editor_{st.session_state.widget_key_version}_{editor_version}",
+    )
+
+    changed, dirty_paths, rejected = _apply_tree_edits(
+        chain, db, flat.nodes, rows, edited.to_dict("records")
+    )
+    if rejected:
+        # Shown after the rerun, once the grid has dropped the invalid cells
+        st.session_state.tree_edit_rejections = rejected
+    if changed or rejected:
+        # New key, so the grid starts clean instead of replaying these edits;
+        # only the grid's own counter, so sidebar widgets keep their state
+        st.session_state.tree_editor_version = editor_version + 1
+        if changed:
+            calculator = st.session_state.calculator
+            if dirty_paths is not None:
+                # Only per-node import toggles: rebuild just those subtrees
+                chain = calculator.recalculate_incremental(chain, dirty_paths)
+                # Same tree, edited in place, so its cached totals are stale
+                st.session_state.aggregator.invalidate(chain)
+            else:
+                chain = calculator.recalculate(chain)
+            st.session_state.current_chain = chain
+        st.rerun()
 
-def _render_node_with_controls(node: ProductionNode, chain, depth: int):
-    """Render a node with checkbox, item name, recipe dropdown, and speed input inline."""
-    db = st.session_state.db
 
-    # Get available recipes for this item
-    recipes = db.get_recipes_for_item(node.item_name)
-    has_recipes = len(recipes) > 0
-
-    # Indent using columns with empty spacer
-    indent_size = depth * 2  # percentage of width for indent
-    if indent_size > 0:
-        cols = st.columns([indent_size, 100 - indent_size])
-        container = cols[1]
-    else:
-        container = st.container()
-
-    with container:
-        if has_recipes:
-            # Has recipes - show checkbox, item, recipe dropdown, speed
-            is_imported = chain.is_path_imported(node.path)
-
-            if is_imported:
-                # Imported: [checkbox] [all btn] Item — import X/min
-                col1, col1b, col2 = st.columns([0.5, 0.5, 10], gap="small")
-                with col1:
-                    new_imported = st.checkbox(
-                        "imp",
-                        value=True,
-                        key=f"import_{node.id}",
-                        label_visibility="collapsed",
-                    )
-                    if not new_imported:
-                        chain.set_node_import(node.path, False)
-                        st.session_state.tree_changed = True
-                with col1b:
-                    if st.button("∀", key=f"all_{node.id}", help=f"Produce ALL {node.item_name}"):
-                        # Currently imported → produce all
-                        chain.set_item_import(node.item_name, False)
-                        st.session_state.tree_changed = True
-                with col2:
-                    st.markdown(f"**{node.item_name}** — 📦 *import {node.target_rate:.2f}/min*")
+def _apply_tree_edits(
+    chain, db, nodes: list[ProductionNode], before: list[dict], after: list[dict]
+) -> tuple[bool, set[tuple[str, ...]] | None, list[str]]:
+    """Apply edited grid rows to the chain.
+
+    Returns whether anything changed, the paths of per-node import toggles
+    if those were the only changes (None if a full recalculation is
+    needed), and a message for each edit that can't be applied.
+    """
+    changed = False
+    dirty_paths: set[tuple[str, ...]] | None = set()
+    rejected: list[str] = []
+    for node, old, new in zip(nodes, before, after):
+        item = node.item_name
+        recipes = db.get_recipes_for_item(item)
+        if not recipes:
+            # Base resource, nothing to edit
+            edited = new["All"] or new["Import"] != old["Import"]
+            if edited or _row_settings_edited(old, new):
+                rejected.append(f"{item} is a base resource and is always imported.")
+            continue
+
+        if new["All"]:
+            # Imported → produce all, producing → import all
+            chain.set_item_import(item, not old["Import"])
+            changed = True
+            dirty_paths = None
+            continue
+        if new["Import"] != old["Import"]:
+            chain.set_node_import(node.path, bool(new["Import"]))
+            changed = True
+            if dirty_paths is not None:
+                dirty_paths.add(node.path)
+            continue
+        if old["Import"]:
+            # Recipe and multipliers only apply while producing
+            if _row_settings_edited(old, new):
+                rejected.append(
+                    f"{item} is imported here; untick Import to change its settings."
+                )
+            continue
+
+        recipe = new["Recipe"]
+        if recipe != old["Recipe"]:
+            if any(r.name == recipe for r in recipes):
+                chain.recipe_selections[item] = recipe
+                changed = True
+                dirty_paths = None
+            elif pd.isna(recipe):
+                rejected.append(f"{item} needs a recipe while it is produced.")
             else:
-                # Producing: layout depends on game mode
-                mode = st.session_state.game_mode
-                has_productivity = mode.has_productivity
-
-                if has_productivity:
-                    # Factorio: [checkbox] [all] Item | [recipe] | [speed] | [prod]
-                    col1, col1b, col2, col3, col4, col5 = st.columns(
-                        [0.5, 0.5, 3, 3, 1.5, 1.5], gap="small"
-                    )
-                else:
-                    # Satisfactory: [checkbox] [all] Item | [recipe] | [speed]
-                    col1, col1b, col2, col3, col4 = st.columns(
-                        [0.5, 0.5, 4, 4, 2], gap="small"
-                    )
-                    col5 = None
-
-                with col1:
-                    new_imported = st.checkbox(
-                        "imp",
-                        value=False,
-                        key=f"import_{node.id}",
-                        label_visibility="collapsed",
-                    )
-                    if new_imported:
-                        chain.set_node_import(node.path, True)
-                        st.session_state.tree_changed = True
-
-                with col1b:
-                    if st.button("∀", key=f"all_{node.id}", help=f"Import ALL {node.item_name}"):
-                        # Currently producing → import all
-                        chain.set_item_import(node.item_name, True)
-                        st.session_state.tree_changed = True
-
-                with col2:
-                    st.markdown(f"**{node.item_name}** — 🏭 {node.machine_count:.2f}x")
-
-                with col3:
-                    if len(recipes) > 1:
-                        recipe_names = [r.name for r in recipes]
-                        current = chain.recipe_selections.get(node.item_name, recipes[0].name)
-                        if current not in recipe_names:
-                            current = recipe_names[0]
-
-                        new_selection = st.selectbox(
-                            "recipe",
-                            options=recipe_names,
-                            index=recipe_names.index(current),
-                            key=f"recipe_{node.id}",
-                            label_visibility="collapsed",
-                        )
-                        if new_selection != chain.recipe_selections.get(node.item_name):
-                            chain.recipe_selections[node.item_name] = new_selection
-                            st.session_state.tree_changed = True
-                    else:
-                        st.caption(f"{node.recipe_name}")
-
-                with col4:
-                    # Speed multiplier (100% = 1.0)
-                    current_speed = chain.speed_multipliers.get(node.recipe_name, 1.0)
-                    new_speed = st.number_input(
-                        "spd",
-                        min_value=0.01,
-                        max_value=10.0,
-                        value=current_speed,
-                        step=0.25,
-                        format="%.2f",
-                        key=f"speed_{node.id}",
-                        label_visibility="collapsed",
-                        help="Speed multiplier",
-                    )
-                    if abs(new_speed - current_speed) > 0.001:
-                        chain.speed_multipliers[node.recipe_name] = new_speed
-                        st.session_state.tree_changed = True
-
-                if col5 is not None:
-                    with col5:
-                        # Productivity multiplier (Factorio only)
-                        current_prod = chain.productivity_multipliers.get(node.recipe_name, 1.0)
-                        new_prod = st.number_input(
-                            "prd",
-                            min_value=1.0,
-                            max_value=5.0,
-                            value=current_prod,
-                            step=0.1,
-                            format="%.2f",
-                            key=f"prod_{node.id}",
-                            label_visibility="collapsed",
-                            help="Productivity multiplier (outputs only)",
-                        )
-                        if abs(new_prod - current_prod) > 0.001:
-                            chain.productivity_multipliers[node.recipe_name] = new_prod
-                            st.session_state.tree_changed = True
-        else:
-            # No recipes - base resource, just show as imported
-            col1, col2 = st.columns([1, 10], gap="small")
-            with col1:
-                st.markdown("📦")
-            with col2:
-                st.markdown(f"**{node.item_name}** — *{node.target_rate:.2f}/min needed*")
-
-    # Render children
-    for child in node.children:
-        _render_node_with_controls(child, chain, depth + 1)
+                rejected.append(f"{recipe} does not produce {item}.")
+
+        speed = new["Speed"]
+        if speed is not None and abs(speed - old["Speed"]) > 0.001:
+            chain.speed_multipliers[node.recipe_name] = speed
+            changed = True
+            dirty_paths = None
+
+        # Productivity is only in the grid for games that have it
+        prod = new.get("Productivity")
+        if prod is not None and abs(prod - old["Productivity"]) > 0.001:
+            chain.productivity_multipliers[node.recipe_name] = prod
+            changed = True
+            dirty_paths = None
+    return changed, dirty_paths, rejected
+
+
+def _row_settings_edited(old: dict, new: dict) -> bool:
+    """Whether a recipe or multiplier was entered on a row that has none."""
+    return any(
+        not pd.isna(new[column]) and new[column] != old[column]
+        for column in ("Recipe", "Speed", "Productivity")
+        if column in new
+    )
@@ -0,0 +1,59 @@
+"""Tests for the dependency calculator."""
+
+from pathlib import Path
+
+import pytest
+
+from satisfactory.data.loader import RecipeDatabase
+from satisfactory.engine.aggregator import ChainAggregator
+from satisfactory.engine.calculator import DependencyCalculator
+from satisfactory.models.build_chain import BuildChain
+
+RECIPE_FILE = Path(__file__).resolve().parent.parent / "recipes.tsv"
+
+
+@pytest.fixture(scope="module")
+def db() -> RecipeDatabase:
+    return RecipeDatabase(RECIPE_FILE)
+
+
+def _silicon_hsc_chain(calculator: DependencyCalculator, db: RecipeDatabase):
+    # Silicon HSC lists Quickwire, Silica and Circuit Board twice each
+    chain = BuildChain(
+        target_item="HSC",
+        target_rate=10.0,
+        recipe_selections={"HSC": "Silicon HSC"},
+        imported_items=db.get_default_imported_items(),
+    )
+    return calculator.recalculate(chain)
+
+
+@pytest.mark.parametrize("input_item", ["Quickwire", "Silica", "Circuit Board"])
+def test_incremental_matches_full_for_duplicate_inputs(db, input_item):
+    calculator = DependencyCalculator(db)
+    aggregator = ChainAggregator(db)
+    path = ("HSC", input_item)
+
+    incremental = _silicon_hsc_chain(calculator, db)
+    assert sum(node.path == path for node in incremental.flatten().nodes) == 2
+    aggregator.aggregate(incremental)  # Cached totals must not survive the edit
+    incremental.set_node_import(path, True)
+    incremental = calculator.recalculate_incremental(incremental, {path})
+    aggregator.invalidate(incremental)
+
+    full = _silicon_hsc_chain(calculator, db)
+    full.set_node_import(path, True)
+    full = calculator.recalculate(full)
+
+    def shape(chain):
+        return [
+            (node.path, node.is_imported, node.recipe_name)
+            for node in chain.flatten().nodes
+        ]
+
+    assert shape(incremental) == shape(full)
+    got = aggregator.aggregate(incremental)
+    expected = aggregator.aggregate(full)
+    assert got.total_power == pytest.approx(expected.total_power)
+    assert got.machine_counts == pytest.approx(expected.machine_counts)
+    assert got.base_resources == pytest.approx(expected.base_resources)